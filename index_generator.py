@@ -1,505 +1,3265 @@
-import os
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+"""React 컴포넌트 폴더용 Index(barrel) 파일 생성기
+
+GUI 없이 동작하는 엔진(스캔 → 추출 → 렌더링 → 쓰기)과 명령행 인터페이스를 제공합니다.
+Tk 창은 index_generator_gui 모듈에 있으며 필요할 때만 불러옵니다.
+
+사용 예:
+    python -m index_generator components/ui lib/utils --style named --extension ts
+    python -m index_generator --manifest barrels.json   # 여러 target을 한 번에 처리
+    python -m index_generator components/ui --style lazy --lazy-loader next --import-map
+    python -m index_generator            # 인자가 없으면 GUI 실행
+"""
+import argparse
+import cProfile
+import difflib
+import fnmatch
+import hashlib
+import heapq
+import itertools
 import json
-from pathlib import Path
-
-class IndexFileGenerator:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("React Components Index File Generator")
-        self.root.geometry("800x600")
-        
-        # 설정 파일 경로
-        self.config_file = "index_generator_config.json"
-        self.load_config()
-        
-        self.setup_ui()
-        
-    def load_config(self):
-        """설정 파일 로드"""
-        self.config = {
-            "last_directory": "",
-            "file_extensions": [".tsx", ".jsx", ".ts", ".js"],
-            "export_style": "named",  # "named" or "default"
-            "use_typescript": True
-        }
-        
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    saved_config = json.load(f)
-                    self.config.update(saved_config)
-            except:
-                pass
-    
-    def save_config(self):
-        """설정 파일 저장"""
+import mmap
+import os
+import re
+import select
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+CONFIG_FILE = "index_generator_config.json"
+CACHE_FILE = "index_generator_cache.json"
+
+# 추출 규칙(classify_content)이 바뀌면 올려서 기존 캐시를 무효화
+EXTRACTION_RULES_VERSION = 4
+CACHE_FORMAT_VERSION = 3
+
+# 이보다 큰 파일은 mmap으로 분석
+MMAP_THRESHOLD_BYTES = 256 * 1024
+# 압축 파일 판별에 쓰는 앞부분 크기
+MINIFIED_PROBE_BYTES = 4096
+
+DEFAULT_CONFIG = {
+    "last_directory": "",
+    "file_extensions": [".tsx", ".jsx", ".ts", ".js"],
+    "export_style": "named",  # "named", "reexport" or "lazy"(컴포넌트마다 import()를 감싼 래퍼)
+    "use_typescript": True,
+    "scan_workers": 0,  # 0이면 CPU 수에 맞춰 자동, 1이면 직렬
+    "scan_executor": "thread",  # "thread"(I/O 위주) or "process"(파싱 위주)
+    "scan_byte_budget": 1024 * 1024,  # 파일당 분석할 최대 바이트 (0이면 무제한)
+    "skip_minified": True,  # 줄바꿈 없는 압축 파일 제외
+    "barrel_mode": "flat",  # "flat"(선택한 폴더에 하나) or "tree"(하위 폴더마다 하나)
+    "skip_files": ["*.min.js", "*.min.mjs", "*.bundle.js", "*.generated.*", "*.gen.*"],  # 읽지 않고 제외할 파일 패턴
+    "use_gitignore": True,  # .gitignore/.ignore에 걸리는 폴더와 파일 제외
+    "exclude_globs": [".*", "node_modules", "coverage", "storybook-static"],  # 내려가지 않을 폴더 (이름, '/'가 있으면 경로 끝부분)
+    "include_globs": [],  # 비어있지 않으면 이 패턴(파일명 또는 상대 경로)에 맞는 파일만 스캔
+    "collision_policy": "warn",  # 같은 barrel에 겹치는 이름: "warn", "error", "prefix"(디렉터리 접두사), "extension"(확장자 순서)
+    "usage_folders": [],  # barrel은 만들지 않고 import만 읽는 폴더들 (예: "app", "pages")
+    "path_aliases": {"@/": "."},  # import 경로 별칭 -> 실행 위치 기준 경로 (tsconfig의 paths)
+    "prune_cycles": False,  # barrel을 다시 import하는 파일(순환)을 barrel에서 제외
+    "prune_unused": False,  # 어디서도 import하지 않는 export를 barrel에서 제외
+    "lazy_loader": "react",  # lazy 스타일의 래퍼: "react"(React.lazy) or "next"(next/dynamic)
+    "deep_import_map": False,  # 선택한 폴더에 이름 -> 모듈 경로 맵(index.imports.json) 생성 (modularizeImports 등에 사용)
+    "side_effects_free": False,  # 선택한 폴더에 package.json이 없으면 "sideEffects" 목록만 있는 package.json 생성
+    "targets": []  # --batch로 한 번에 처리할 폴더들 (항목 형식은 resolve_targets 참고)
+}
+
+EXPORT_STYLES = ("named", "reexport", "lazy")
+LAZY_LOADERS = {
+    "react": "import { lazy } from 'react'",
+    "next": "import dynamic from 'next/dynamic'"
+}
+IMPORT_MAP_FILENAME = "index.imports.json"
+# side_effects_free로 만드는 package.json: 스타일시트 import만 부작용으로 남김
+SIDE_EFFECTS_MANIFEST = {"sideEffects": ["*.css", "*.scss", "*.sass", "*.less"]}
+BARREL_MODES = ("flat", "tree")
+SCAN_EXECUTORS = ("thread", "process")
+IGNORE_FILES = (".gitignore", ".ignore")
+COLLISION_POLICIES = ("warn", "error", "prefix", "extension")
+
+
+def load_config(config_file=CONFIG_FILE):
+    """설정 파일 로드"""
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+
+    if os.path.exists(config_file):
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with open(config_file, 'r') as f:
+                saved_config = json.load(f)
+                config.update(saved_config)
         except:
             pass
-    
-    def setup_ui(self):
-        """UI 설정"""
-        # 메인 프레임
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # 폴더 선택 영역
-        folder_frame = ttk.LabelFrame(main_frame, text="폴더 선택", padding="10")
-        folder_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
-        
-        # 선택된 폴더들을 표시할 리스트박스
-        ttk.Label(folder_frame, text="선택된 폴더들:").grid(row=0, column=0, sticky=tk.W)
-        
-        list_frame = ttk.Frame(folder_frame)
-        list_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=(0, 10))
-        
-        self.folder_listbox = tk.Listbox(list_frame, height=4, selectmode=tk.SINGLE)
-        folder_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.folder_listbox.yview)
-        self.folder_listbox.configure(yscrollcommand=folder_scrollbar.set)
-        
-        self.folder_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        folder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # 버튼들
-        button_frame = ttk.Frame(folder_frame)
-        button_frame.grid(row=1, column=1, sticky=tk.N)
-        
-        ttk.Button(button_frame, text="폴더 추가", command=self.add_folder).pack(pady=2)
-        ttk.Button(button_frame, text="선택 제거", command=self.remove_folder).pack(pady=2)
-        ttk.Button(button_frame, text="모두 제거", command=self.clear_folders).pack(pady=2)
-        
-        folder_frame.columnconfigure(0, weight=1)
-        list_frame.columnconfigure(0, weight=1)
-        
-        # 선택된 폴더들 저장할 리스트
-        self.selected_folders = []
-        
-        # 설정 영역
-        settings_frame = ttk.LabelFrame(main_frame, text="설정", padding="10")
-        settings_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
-        
-        # TypeScript/JavaScript 선택
-        self.use_typescript = tk.BooleanVar(value=self.config["use_typescript"])
-        ttk.Checkbutton(settings_frame, text="TypeScript 사용 (.ts/.tsx)", variable=self.use_typescript).grid(row=0, column=0, sticky=tk.W)
-        
-        # Export 스타일 선택
-        ttk.Label(settings_frame, text="Export 스타일:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
-        self.export_style = tk.StringVar(value=self.config["export_style"])
-        ttk.Radiobutton(settings_frame, text="Named exports (export { Component })", variable=self.export_style, value="named").grid(row=2, column=0, sticky=tk.W)
-        ttk.Radiobutton(settings_frame, text="Re-exports (export * from './Component')", variable=self.export_style, value="reexport").grid(row=3, column=0, sticky=tk.W)
-        
-        # 파일 목록 영역
-        files_frame = ttk.LabelFrame(main_frame, text="발견된 컴포넌트 파일들", padding="10")
-        files_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
-        
-        # 트리뷰 생성
-        self.file_tree = ttk.Treeview(files_frame, columns=('path', 'type'), show='tree headings')
-        self.file_tree.heading('#0', text='파일명')
-        self.file_tree.heading('path', text='경로')
-        self.file_tree.heading('type', text='타입')
-        
-        # 스크롤바
-        scrollbar = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
-        self.file_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.file_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        
-        files_frame.columnconfigure(0, weight=1)
-        files_frame.rowconfigure(0, weight=1)
-        
-        # 미리보기 영역
-        preview_frame = ttk.LabelFrame(main_frame, text="생성될 Index 파일 미리보기", padding="10")
-        preview_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
-        
-        self.preview_text = tk.Text(preview_frame, height=10, width=80)
-        preview_scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.preview_text.yview)
-        self.preview_text.configure(yscrollcommand=preview_scrollbar.set)
-        
-        self.preview_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        preview_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        
-        preview_frame.columnconfigure(0, weight=1)
-        preview_frame.rowconfigure(0, weight=1)
-        
-        # 버튼 영역
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(button_frame, text="파일 스캔", command=self.scan_files).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="미리보기 생성", command=self.generate_preview).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="선택한 폴더들에 Index 파일 생성", command=self.generate_index_files).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="설정 저장", command=self.save_config).pack(side=tk.LEFT, padx=5)
-        
-        # 그리드 가중치 설정
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(2, weight=1)
-        main_frame.rowconfigure(3, weight=1)
-        
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        
-        # 변수 변경 시 미리보기 자동 업데이트
-        self.use_typescript.trace('w', lambda *args: self.generate_preview())
-        self.export_style.trace('w', lambda *args: self.generate_preview())
-        
-    def add_folder(self):
-        """폴더 추가 다이얼로그"""
-        folder_selected = filedialog.askdirectory(
-            title="컴포넌트 폴더를 선택하세요",
-            initialdir=self.config.get("last_directory", "")
-        )
-        
-        if folder_selected:
-            if folder_selected not in self.selected_folders:
-                self.selected_folders.append(folder_selected)
-                self.folder_listbox.insert(tk.END, folder_selected)
-                self.config["last_directory"] = folder_selected
-                self.scan_files()
-            else:
-                messagebox.showinfo("알림", "이미 선택된 폴더입니다.")
-    
-    def remove_folder(self):
-        """선택된 폴더 제거"""
-        selection = self.folder_listbox.curselection()
-        if selection:
-            index = selection[0]
-            removed_folder = self.selected_folders.pop(index)
-            self.folder_listbox.delete(index)
-            self.scan_files()
-        else:
-            messagebox.showwarning("경고", "제거할 폴더를 선택해주세요.")
-    
-    def clear_folders(self):
-        """모든 폴더 제거"""
-        if self.selected_folders:
-            if messagebox.askyesno("확인", "모든 폴더를 제거하시겠습니까?"):
-                self.selected_folders.clear()
-                self.folder_listbox.delete(0, tk.END)
-                # 파일 트리와 미리보기도 초기화
-                for item in self.file_tree.get_children():
-                    self.file_tree.delete(item)
-                self.preview_text.delete(1.0, tk.END)
-                if hasattr(self, 'component_files'):
-                    self.component_files.clear()
-    
-    def select_folder(self):
-        """이전 버전과의 호환성을 위해 남겨둠"""
-        self.add_folder()
-    
-    def scan_files(self):
-        """선택된 모든 폴더에서 컴포넌트 파일들 스캔"""
-        if not self.selected_folders:
-            # 기존 항목 제거
-            for item in self.file_tree.get_children():
-                self.file_tree.delete(item)
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, "// 폴더를 추가해주세요.")
+
+    return config
+
+
+def save_config(config, config_file=CONFIG_FILE):
+    """설정 파일 저장"""
+    try:
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
+    except:
+        pass
+
+
+def to_component_name(filename):
+    """파일명에서 컴포넌트 이름 추출 (캐멀케이스로 변환)"""
+    name_without_ext = os.path.splitext(filename)[0]
+    return ''.join(word.capitalize() for word in name_without_ext.replace('-', ' ').replace('_', ' ').split())
+
+
+def index_extension(use_typescript):
+    """TypeScript 사용 여부에 따른 Index 파일 확장자"""
+    return '.ts' if use_typescript else '.js'
+
+
+def default_cache_file(config_file=CONFIG_FILE):
+    """설정 파일과 같은 폴더에 두는 스캔 캐시 파일 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(config_file)), CACHE_FILE)
+
+
+# JS/TS/JSX/TSX 토큰 (문자열은 줄바꿈에서 끊어 JSX 텍스트의 ' 가 파일 전체를 삼키지 않게 함)
+# mmap을 그대로 탐색할 수 있도록 바이트 패턴을 사용 (UTF-8 멀티바이트는 식별자 문자로 취급)
+JS_TOKEN_RE = re.compile(rb"""
+    (?:\s+|//[^\n]*|/\*.*?(?:\*/|\Z))*
+    (?:
+    (?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+  | (?P<template>`)
+  | (?P<ident>[A-Za-z_$\x80-\xff][\w$\x80-\xff]*)
+  | (?P<number>\.?\d[\w.]*)
+  | (?P<punct>=>|\.\.\.|\S)
+  | (?P<end>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+# export/import/require를 찾는 동안 한 번에 건너뛸 수 있는 구간 (키워드, 템플릿, 나눗셈인지 정규식인지 모를 / 가 없는 구간)
+# 단어, 공백을 포함한 기호 묶음, 문자열, 주석 단위로 읽으며 < > ' " ) ] 바로 뒤의 / 는 정규식이 아니라 구간에 넣습니다.
+# 템플릿 치환식 안에서는 } 가 템플릿 본문으로 돌아가는 표시일 수 있어 구간에 넣지 않습니다(%s 자리).
+JS_SKIP_PATTERN = rb"""
+    (?:
+      [^\w$\x80-\xff'"`/%s]+
+    | (?!(?:export|import|require)(?![\w$\x80-\xff]))[\w$\x80-\xff]+
+    | (?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+    | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+    | (?<=[<>'")\]])/(?![/*])
+    )+
+"""
+JS_SKIP_RE = re.compile(JS_SKIP_PATTERN % b'', re.VERBOSE | re.DOTALL)
+JS_SKIP_TEMPLATE_RE = re.compile(JS_SKIP_PATTERN % b'}', re.VERBOSE | re.DOTALL)
+JS_WORD_BYTES = bytes(range(0x80, 0x100)) + b'$_0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+# 건너뛴 구간의 괄호 (나머지는 빈 문자열)
+JS_BRACKET_RE = re.compile(rb"""[^'"/(){}\[\]]+|'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?|//[^\n]*|/\*.*?(?:\*/|\Z)|/|([(){}\[\]])""",
+                           re.DOTALL)
+JS_BRACKET_OPENERS = {b'{': '{', b'(': '(', b'[': '['}
+JS_BRACKET_TABLE = bytes.maketrans(b'{[(}])', b'((()))')
+# 건너뛰지 않고 읽는 토큰 중 괄호 깊이를 쓰거나 바꾸는 토큰 (미뤄 둔 구간의 괄호를 먼저 반영)
+JS_DEPTH_TOKENS = {'{', '}', '(', ')', '[', ']', 'export', 'import', 'require'}
+JS_SCAN_KEYWORDS = (b'export', b'import', b'require')
+JS_REGEX_LITERAL_RE = re.compile(rb"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+JS_TEMPLATE_CHUNK_RE = re.compile(rb"(?:[^`\\$]|\\.|\$(?!\{))*(`|\$\{)?", re.DOTALL)
+
+# 이 토큰 뒤의 / 는 나눗셈이 아니라 정규식 리터럴 (<, > 뒤는 JSX 닫는 태그로 보고 제외)
+JS_REGEX_PREFIX_PUNCT = set('(,=:[!&|?{};+-*%~^') | {'=>', '...'}
+JS_REGEX_PREFIX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete',
+                            'void', 'throw', 'case', 'do', 'else', 'yield', 'await'}
+# export const 선언을 읽다가 이 키워드를 만나면 다음 문장으로 봄
+JS_STATEMENT_KEYWORDS = {'export', 'import', 'const', 'let', 'var', 'function', 'class',
+                         'interface', 'enum'}
+JS_OPENERS = {'{': '}', '(': ')', '[': ']'}
+
+
+def tokenize_js(content, limit=None, skipping=None):
+    """주석과 문자열/템플릿/정규식 리터럴을 건너뛰며 (kind, value, depth) 토큰을 차례로 생성
+
+    content는 bytes 또는 mmap이며 limit 바이트까지만 읽습니다.
+    depth는 괄호 중첩 깊이이며 여는/닫는 괄호 자신은 바깥 깊이로 표시됩니다.
+    따옴표 문자열은 따옴표가 붙은 값으로, 템플릿과 정규식 리터럴은 값 없이 ('string', None, depth)로 나옵니다. JSX는 해석하지 않으므로
+    텍스트 속 따옴표 때문에 깊이가 어긋날 수 있는데, 줄 맨 앞의 export에서 다시 맞춥니다.
+    skipping(dict)의 'floor'가 None이 아니고 깊이가 floor보다 깊은 동안은 export/import/require가 아닌
+    토큰들을 괄호 깊이만 맞추며 한 번에 건너뛰고 그 구간의 마지막 토큰만 냅니다. 구간은 깊이가 floor로
+    돌아오는 닫는 괄호에서 끊깁니다. floor가 -1(키워드 찾기)이면 'end'(마지막 키워드 위치)를 지나서 멈춥니다.
+    """
+    stack = []  # 여는 괄호 또는 템플릿 치환('${')
+    pending = []  # 괄호를 아직 stack에 반영하지 않은 건너뛴 구간들 (줄 맨 앞의 export에서 버림)
+    prev = None
+    pos = 0
+    length = len(content) if limit is None else min(limit, len(content))
+
+    while pos < length:
+        floor = None if skipping is None else skipping['floor']
+        if floor is not None and floor >= 0 and pending:
+            settle_brackets(stack, content, pending)
+        if floor is not None and len(stack) > floor:
+            if floor < 0 and pos > skipping['end']:
+                return
+            skipped = (JS_SKIP_TEMPLATE_RE if '${' in stack else JS_SKIP_RE).match(content, pos, length)
+            if skipped:
+                end = skipped.end()
+                token = None
+                if floor < 0 and '${' not in stack:
+                    # 키워드를 찾는 동안은 괄호 깊이를 쓸 때까지 미룸
+                    pending.append((pos, end))
+                else:
+                    end, closer = skip_brackets(stack, content, pos, end, floor)
+                    if closer is not None:
+                        token = ('punct', closer)
+                if token is None:
+                    end, token = skipped_token(content, pos, skipped)
+                pos = end
+                if token is not None:  # 공백과 주석만 건너뛰었으면 이전 토큰 그대로
+                    prev = (token[0], token[1], len(stack))
+                    yield prev
+                continue
+
+        match = JS_TOKEN_RE.match(content, pos, length)
+        kind = match.lastgroup
+        if kind == 'end':
             return
-        
-        # 기존 항목 제거
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
-        
-        self.component_files = {}  # 폴더별로 컴포넌트 파일들을 저장
-        total_files = 0
-        
-        # 각 선택된 폴더에서 컴포넌트 파일 찾기
-        for folder in self.selected_folders:
-            if not os.path.exists(folder):
+
+        start = match.start(kind)
+        if kind == 'punct' and content[start:start + 1] == b'/' and (
+                prev is None
+                or (prev[0] == 'punct' and prev[1] in JS_REGEX_PREFIX_PUNCT)
+                or (prev[0] == 'ident' and prev[1] in JS_REGEX_PREFIX_KEYWORDS)):
+            regex_literal = JS_REGEX_LITERAL_RE.match(content, start, length)
+            if regex_literal:
+                pos = regex_literal.end()
+                prev = ('string', None, len(stack))
+                yield prev
                 continue
-                
-            folder_files = []
-            folder_name = os.path.basename(folder)
-            
-            # 폴더별 트리 노드 생성
-            folder_node = self.file_tree.insert('', 'end', text=f"📁 {folder_name}", values=(folder, 'folder'))
-            
-            # 컴포넌트 파일 찾기
-            for root, dirs, files in os.walk(folder):
-                # node_modules, .git 등 제외
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'node_modules']
-                
-                for file in files:
-                    if any(file.endswith(ext) for ext in self.config["file_extensions"]):
-                        file_path = os.path.join(root, file)
-                        relative_path = os.path.relpath(file_path, folder)
-                        
-                        # 컴포넌트 정보 추출
-                        component_info = self.extract_component_info(file_path, file)
-                        if component_info:
-                            file_info = {
-                                'file_path': file_path,
-                                'relative_path': relative_path,
-                                'filename': file,
-                                'component_name': component_info['name'],
-                                'export_type': component_info['type'],
-                                'directory': os.path.dirname(relative_path),
-                                'folder': folder
-                            }
-                            folder_files.append(file_info)
-                            total_files += 1
-                            
-                            # 폴더 노드 하위에 파일 추가
-                            self.file_tree.insert(folder_node, 'end', 
-                                                text=file,
-                                                values=(relative_path, component_info['type']))
-            
-            self.component_files[folder] = folder_files
-            
-            # 폴더가 비어있으면 표시
-            if not folder_files:
-                self.file_tree.insert(folder_node, 'end', 
-                                    text="(컴포넌트 파일 없음)",
-                                    values=("", "empty"))
-        
-        self.generate_preview()
-        messagebox.showinfo("완료", f"{len(self.selected_folders)}개 폴더에서 총 {total_files}개의 컴포넌트 파일을 찾았습니다.")
-    
-    def extract_component_info(self, file_path, filename):
-        """파일에서 컴포넌트 정보 추출"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 파일명에서 컴포넌트 이름 추출
-            name_without_ext = os.path.splitext(filename)[0]
-            
-            # 캐멀케이스로 변환
-            component_name = ''.join(word.capitalize() for word in name_without_ext.replace('-', ' ').replace('_', ' ').split())
-            
-            # Export 타입 확인
-            if 'export default' in content:
-                export_type = 'default'
-            elif f'export {{' in content or f'export const {component_name}' in content or f'export function {component_name}' in content:
-                export_type = 'named'
+
+        value = match.group(kind).decode('utf-8', 'replace')
+        pos = match.end()
+        if pending and (kind == 'template' or value in JS_DEPTH_TOKENS):
+            if value == 'export' and (start == 0 or content[start - 1:start] == b'\n'):
+                pending.clear()  # 아래에서 stack도 비움
             else:
-                export_type = 'unknown'
-            
-            return {
-                'name': component_name,
-                'type': export_type
-            }
-        except:
-            return None
-    
-    def generate_preview(self):
-        """여러 폴더의 Index 파일 미리보기 생성"""
-        if not hasattr(self, 'component_files') or not self.component_files:
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, "// 먼저 파일을 스캔해주세요.")
-            return
-        
-        extension = '.ts' if self.use_typescript.get() else '.js'
-        export_style = self.export_style.get()
-        
-        all_previews = []
-        
-        # 각 폴더별로 미리보기 생성
-        for folder, files in self.component_files.items():
-            if not files:  # 빈 폴더는 건너뛰기
+                settle_brackets(stack, content, pending)
+
+        if kind == 'template' or (kind == 'punct' and value == '}' and stack and stack[-1] == '${'):
+            if kind == 'punct':
+                stack.pop()
+            # 템플릿 문자열 본문을 읽다가 ${ 를 만나면 치환식 토큰으로 돌아감
+            chunk = JS_TEMPLATE_CHUNK_RE.match(content, pos, length)
+            pos = chunk.end()
+            if chunk.group(1) == b'${':
+                stack.append('${')
                 continue
-                
-            folder_name = os.path.basename(folder)
-            content = []
-            
-            if export_style == "named":
-                # Named exports 스타일
-                for comp in sorted(files, key=lambda x: x['component_name']):
-                    file_path = os.path.splitext(comp['relative_path'])[0]
-                    if comp['export_type'] == 'default':
-                        content.append(f"export {{ default as {comp['component_name']} }} from './{file_path}'")
-                    else:
-                        content.append(f"export {{ {comp['component_name']} }} from './{file_path}'")
-            
-            elif export_style == "reexport":
-                # Re-export 스타일
-                for comp in sorted(files, key=lambda x: x['relative_path']):
-                    file_path = os.path.splitext(comp['relative_path'])[0]
-                    content.append(f"export * from './{file_path}'")
-            
-            all_previews.append('\n'.join(content))
-        
-        preview_content = '\n\n'.join(all_previews)
-        
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, preview_content)
-    
-    def generate_index_file(self):
-        """실제 Index 파일 생성"""
-        folder = self.folder_path.get()
-        if not folder or not os.path.exists(folder):
-            messagebox.showerror("오류", "유효한 폴더를 선택해주세요.")
+            prev = ('string', None, len(stack))
+            yield prev
+            continue
+
+        if kind == 'number':
+            kind = 'ident'
+        elif kind == 'ident' and value == 'export' and stack and (start == 0 or content[start - 1:start] == b'\n'):
+            # JSX 텍스트의 ' 등으로 괄호 깊이가 어긋났어도 줄 맨 앞의 export에서 다시 맞춤
+            stack.clear()
+
+        if kind == 'punct':
+            if value in JS_OPENERS:
+                prev = (kind, value, len(stack))
+                stack.append(value)
+                yield prev
+                continue
+            if value in ('}', ')', ']') and stack:
+                stack.pop()
+
+        prev = (kind, value, len(stack))
+        yield prev
+
+
+def skipped_token(content, start, skipped):
+    """JS_SKIP_RE로 건너뛴 구간의 (끝, 마지막 토큰 (kind, value) 또는 None) 반환
+
+    마지막 토큰은 다음 / 가 정규식인지, 다음 import 앞이 '.' 인지 판단하는 데만 쓰입니다.
+    구간 끝의 주석은 그 앞 구간을 다시 맞춰 보며 건너뜁니다.
+    """
+    end = stop = skipped.end()
+    while True:
+        tail = content[start:stop].rstrip()
+        stop = start + len(tail)
+        if not tail:
+            return end, None
+        if skipped.end('comment') >= stop:
+            stop = skipped.start('comment')
+            skipped = JS_SKIP_RE.match(content, start, stop) if stop > start else None
+            if skipped is None:
+                return end, None
+            continue
+        if skipped.end('string') >= stop:
+            return end, ('string', tail[skipped.start('string') - start:].decode('utf-8', 'replace'))
+        word = len(tail) - len(tail.rstrip(JS_WORD_BYTES))
+        if word:
+            return end, ('ident', tail[-word:].decode('utf-8', 'replace'))
+        for punct in (b'=>', b'...'):
+            if tail.endswith(punct):
+                return end, ('punct', punct.decode())
+        return end, ('punct', tail[-1:].decode('utf-8', 'replace'))
+
+
+def settle_brackets(stack, content, pending):
+    """미뤄 둔 구간들의 괄호를 차례로 stack에 반영"""
+    for start, end in pending:
+        skip_brackets(stack, content, start, end, -1)
+    pending.clear()
+
+
+def skip_brackets(stack, content, start, end, floor):
+    """건너뛴 구간의 괄호를 stack에 반영하고 (구간 끝, 깊이를 floor로 되돌린 닫는 괄호 또는 None) 반환
+
+    구간 안에서 짝이 맞는 괄호는 바깥 깊이에 영향이 없으므로 바이트 치환으로 지운 뒤 남은 ')...)(...(' 만 반영하고,
+    깊이가 floor까지 내려갈 수 있을 때만 괄호를 하나씩 따라가 그 닫는 괄호에서 구간을 끊습니다.
+    """
+    brackets = b''.join(JS_BRACKET_RE.findall(content, start, end)).translate(JS_BRACKET_TABLE)
+    while b'()' in brackets:
+        brackets = brackets.replace(b'()', b'')
+    closers = brackets.count(b')')
+
+    if floor < 0 or len(stack) - closers > floor:
+        del stack[max(len(stack) - closers, 0):]
+        stack.extend('(' * (len(brackets) - closers))  # 여는 괄호 종류는 템플릿 치환('${')과 구분만 하면 됨
+        return end, None
+
+    for bracket in JS_BRACKET_RE.finditer(content, start, end):
+        opener = bracket.group(1)
+        if opener in JS_BRACKET_OPENERS:
+            stack.append(JS_BRACKET_OPENERS[opener])
+        elif opener and stack:
+            stack.pop()
+            if len(stack) == floor:
+                return bracket.end(), opener.decode()
+    return end, None
+
+
+class TokenStream:
+    """한 토큰을 미리 볼 수 있는 토큰 이터레이터"""
+
+    def __init__(self, tokens, skipping=None):
+        self.tokens = tokens
+        self.buffered = None
+        self.skipping = skipping  # tokenize_js에 넘긴 skipping dict
+
+    def skip(self, floor):
+        """floor보다 깊은 괄호 안의 관심 없는 토큰을 묶어서 건너뛰도록 설정 (-1: 모든 깊이, None: 끄기)"""
+        if self.skipping is not None:
+            self.skipping['floor'] = floor
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        token = self.next()
+        if token is None:
+            raise StopIteration
+        return token
+
+    def next(self):
+        if self.buffered is not None:
+            token, self.buffered = self.buffered, None
+            return token
+        return next(self.tokens, None)
+
+    def peek(self):
+        if self.buffered is None:
+            self.buffered = next(self.tokens, None)
+        return self.buffered
+
+
+def is_token(token, kind, *values):
+    """토큰 종류(와 값) 비교"""
+    return token is not None and token[0] == kind and (not values or token[1] in values)
+
+
+def scan_exports(content, limit=None):
+    """한 번의 선형 탐색으로 파일이 export하는 심볼들 수집 (content는 str, bytes 또는 mmap)
+
+    반환값: {'default': bool, 'names': [...], 'types': [...], 'star': bool, 'imports': [...]}
+    names는 값 export(재export 포함), types는 type/interface export,
+    star는 `export * from` 재export 여부입니다. imports는 [모듈 경로, 'import' 또는 'reexport',
+    [[가져오는 이름, 로컬/내보내는 이름], ...]] 목록이며 네임스페이스나 동적 import는 '*'로 적습니다.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    exports = {'default': False, 'names': [], 'types': [], 'star': False, 'imports': []}
+    length = len(content) if limit is None else min(limit, len(content))
+    end = max(content.rfind(keyword, 0, length) for keyword in JS_SCAN_KEYWORDS)
+    if end < 0:
+        return exports
+
+    # 키워드를 찾는 동안만 관심 없는 토큰을 묶어서 건너뛰고(마지막 키워드 뒤는 읽지 않음),
+    # export/import 문을 읽을 때는 토큰을 하나씩 읽음
+    skipping = {'floor': -1, 'end': end}
+    tokens = TokenStream(tokenize_js(content, limit, skipping), skipping)
+    prev = None
+
+    for token in tokens:
+        tokens.skip(None)
+        if is_token(prev, 'punct', '.'):
+            pass
+        elif token[2] == 0 and is_token(token, 'ident', 'export'):
+            parse_export(tokens, exports)
+        elif is_token(token, 'ident', 'import', 'require'):
+            parse_import(tokens, exports, token)
+        prev = token
+        tokens.skip(-1)
+
+    exports['names'] = list(dict.fromkeys(exports['names']))
+    exports['types'] = list(dict.fromkeys(exports['types']))
+    return exports
+
+
+def add_export_name(exports, name, is_type=False):
+    """export 이름 기록 ('default'는 default export로 처리)"""
+    if name == 'default':
+        exports['default'] = True
+    elif is_type:
+        exports['types'].append(name)
+    else:
+        exports['names'].append(name)
+
+
+def add_import(exports, source, kind, names):
+    """import/재export 한 건 기록 (source는 따옴표가 붙은 문자열 토큰 값)
+
+    템플릿이나 정규식 리터럴(값이 None)은 모듈 경로를 알 수 없으므로 기록하지 않습니다.
+    """
+    if source is None:
+        return
+    exports['imports'].append([source[1:-1] if source[-1:] == source[:1] else source[1:], kind, names])
+
+
+def parse_import(tokens, exports, keyword):
+    """import 문과 import()/require() 호출에서 모듈 경로와 가져오는 이름 읽기"""
+    if is_token(tokens.peek(), 'punct', '('):
+        tokens.next()
+        source = tokens.next()
+        if is_token(source, 'string') and is_token(tokens.peek(), 'punct', ')'):
+            add_import(exports, source[1], 'import', [['*', None]])
+        return
+    if keyword[1] != 'import' or keyword[2] != 0:
+        return
+
+    names = []
+    after_as = False
+    token = tokens.next()
+    if is_token(token, 'ident', 'type') and not is_token(tokens.peek(), 'punct', ',') \
+            and not is_token(tokens.peek(), 'ident', 'from'):
+        token = tokens.next()  # import type ...
+
+    while token is not None:
+        if is_token(token, 'string'):
+            add_import(exports, token[1], 'import', names)  # import 'side-effect' 또는 from 뒤의 경로
             return
-        
-        if not hasattr(self, 'component_files') or not self.component_files:
-            messagebox.showerror("오류", "먼저 파일을 스캔해주세요.")
+        if is_token(token, 'punct', '*'):
+            names.append(['*', None])
+        elif is_token(token, 'punct', '{'):
+            names.extend([imported, local] for imported, local, _ in read_specifiers(tokens))
+        elif is_token(token, 'punct', '='):
+            # TS: import x = require('a')
+            token = tokens.next()
+            if is_token(token, 'ident', 'require'):
+                parse_import(tokens, exports, token)
             return
-        
-    def generate_index_files(self):
-        """선택된 모든 폴더에 Index 파일들 생성"""
-        if not self.selected_folders:
-            messagebox.showerror("오류", "폴더를 선택해주세요.")
+        elif is_token(token, 'ident', 'as'):
+            after_as = True
+        elif is_token(token, 'ident') and token[1] != 'from':
+            if token[1] in JS_STATEMENT_KEYWORDS:
+                return
+            if after_as and names:
+                names[-1][1] = token[1]
+            else:
+                names.append(['default', token[1]])
+            after_as = False
+        elif not is_token(token, 'ident', 'from') and not is_token(token, 'punct', ','):
             return
-        
-        if not hasattr(self, 'component_files') or not self.component_files:
-            messagebox.showerror("오류", "먼저 파일을 스캔해주세요.")
+        token = tokens.next()
+
+
+def read_specifiers(tokens):
+    """`{ a, b as c, type T, default as D }` 목록을 (원래 이름, 바뀐 이름, type 여부) 목록으로 읽기 (여는 괄호 다음부터)"""
+    specifiers = []
+    group = []
+    for token in tokens:
+        if token[2] == 0 or is_token(token, 'punct', ','):
+            names = [value for kind, value, _ in group if kind == 'ident']
+            if names:
+                is_type = len(names) > 1 and names[0] == 'type' and names[1] != 'as'
+                if is_type:
+                    names = names[1:]
+                specifiers.append((names[0], names[-1], is_type))
+            group = []
+            if token[2] == 0:
+                break
+        else:
+            group.append(token)
+    return specifiers
+
+
+def parse_reexport_source(tokens, exports, names):
+    """`... from './x'` 가 이어지면 재export로 기록"""
+    if is_token(tokens.peek(), 'ident', 'from'):
+        tokens.next()
+        source = tokens.next()
+        if is_token(source, 'string'):
+            add_import(exports, source[1], 'reexport', names)
+
+
+def parse_export(tokens, exports):
+    """`export` 키워드 다음 토큰들을 읽어 export 심볼 기록"""
+    token = tokens.next()
+    if is_token(token, 'ident', 'declare'):
+        token = tokens.next()
+    if token is None:
+        return
+
+    if is_token(token, 'ident', 'default'):
+        exports['default'] = True
+    elif is_token(token, 'punct', '*'):
+        if is_token(tokens.peek(), 'ident', 'as'):
+            tokens.next()
+            name = tokens.next()
+            if is_token(name, 'ident'):
+                add_export_name(exports, name[1])
+                parse_reexport_source(tokens, exports, [['*', name[1]]])
+        else:
+            exports['star'] = True
+            parse_reexport_source(tokens, exports, [['*', None]])
+    elif is_token(token, 'punct', '{'):
+        specifiers = parse_export_specifiers(tokens, exports, False)
+        parse_reexport_source(tokens, exports, [[imported, exported] for imported, exported, _ in specifiers])
+    elif is_token(token, 'ident', 'type'):
+        name = tokens.peek()
+        if is_token(name, 'punct', '{'):
+            tokens.next()
+            specifiers = parse_export_specifiers(tokens, exports, True)
+            parse_reexport_source(tokens, exports, [[imported, exported] for imported, exported, _ in specifiers])
+        elif is_token(name, 'ident'):
+            add_export_name(exports, tokens.next()[1], True)
+    elif is_token(token, 'ident', 'interface'):
+        name = tokens.next()
+        if is_token(name, 'ident'):
+            add_export_name(exports, name[1], True)
+    elif is_token(token, 'ident', 'const') and is_token(tokens.peek(), 'ident', 'enum'):
+        tokens.next()
+        name = tokens.next()
+        if is_token(name, 'ident'):
+            add_export_name(exports, name[1])
+    elif is_token(token, 'ident', 'const', 'let', 'var'):
+        parse_export_declarators(tokens, exports)
+    else:
+        # export async function / function* / abstract class / class / enum / namespace / import A =
+        if is_token(token, 'ident', 'async', 'abstract'):
+            token = tokens.next()
+        if is_token(token, 'ident', 'function', 'class', 'enum', 'namespace', 'module', 'import'):
+            name = tokens.next()
+            if is_token(name, 'punct', '*'):
+                name = tokens.next()
+            if is_token(name, 'ident'):
+                add_export_name(exports, name[1])
+
+
+def parse_export_specifiers(tokens, exports, type_only):
+    """`export { ... }` 명시자들을 읽어 export 이름 기록하고 명시자 목록 반환 (여는 괄호 다음부터)"""
+    specifiers = read_specifiers(tokens)
+    for _, exported, is_type in specifiers:
+        # 마지막 이름이 export되는 이름
+        add_export_name(exports, exported, type_only or is_type)
+    return specifiers
+
+
+def parse_export_declarators(tokens, exports):
+    """`export const a = 1, { b, c: d } = obj` 처럼 선언된 이름들 읽기"""
+    while True:
+        token = tokens.next()
+        if is_token(token, 'punct', '{', '['):
+            # 구조 분해: 키(a:)나 기본값(= x)이 아닌 이름만
+            prev = token
+            for inner in tokens:
+                if inner[2] == 0:
+                    break
+                if (is_token(inner, 'ident') and not is_token(tokens.peek(), 'punct', ':')
+                        and is_token(prev, 'punct', '{', '[', ',', ':', '...')):
+                    add_export_name(exports, inner[1])
+                prev = inner
+        elif is_token(token, 'ident'):
+            add_export_name(exports, token[1])
+        else:
             return
-        
-        extension = '.ts' if self.use_typescript.get() else '.js'
-        export_style = self.export_style.get()
-        index_filename = f"index{extension}"
-        
-        created_files = []
-        skipped_files = []
-        error_files = []
-        
-        # 각 폴더별로 Index 파일 생성
-        for folder, files in self.component_files.items():
-            if not files:  # 빈 폴더는 건너뛰기
+
+        # 타입 주석과 초기값은 건너뛰고 같은 깊이의 ',' 에서 다음 선언으로 (괄호 안은 한 번에 건너뜀)
+        in_annotation = False
+        angle = 0
+        tokens.skip(0)
+        while True:
+            token = tokens.peek()
+            if token is None:
+                return
+            if token[2] == 0:
+                if is_token(token, 'punct', ';'):
+                    tokens.next()
+                    return
+                if is_token(token, 'ident') and token[1] in JS_STATEMENT_KEYWORDS:
+                    return
+            tokens.next()
+            if token[2] != 0:
                 continue
-                
-            index_path = os.path.join(folder, index_filename)
-            
-            # 기존 파일이 있는지 확인
-            if os.path.exists(index_path):
-                folder_name = os.path.basename(folder)
-                response = messagebox.askyesnocancel(
-                    "확인", 
-                    f"{folder_name} 폴더의 {index_filename} 파일이 이미 존재합니다.\n\n"
-                    f"예: 덮어쓰기\n아니오: 건너뛰기\n취소: 전체 작업 중단"
-                )
-                
-                if response is None:  # 취소
-                    break
-                elif response is False:  # 건너뛰기
-                    skipped_files.append(index_path)
-                    continue
-                # response is True일 때는 덮어쓰기 진행
-            
+            if is_token(token, 'punct', ':') and angle == 0:
+                in_annotation = True
+            elif in_annotation and is_token(token, 'punct', '<'):
+                angle += 1
+            elif in_annotation and is_token(token, 'punct', '>') and angle:
+                angle -= 1
+            elif is_token(token, 'punct', '=') and angle == 0:
+                in_annotation = False
+            elif is_token(token, 'punct', ',') and angle == 0:
+                break
+        tokens.skip(None)
+
+
+def classify_content(content, filename, limit=None):
+    """파일 내용에서 컴포넌트 이름과 Export 타입, export 심볼들 판별"""
+    component_name = to_component_name(filename)
+    exports = scan_exports(content, limit)
+
+    # Export 타입 확인
+    if exports['default']:
+        export_type = 'default'
+    elif exports['names'] or exports['types'] or exports['star']:
+        export_type = 'named'
+    else:
+        export_type = 'unknown'
+
+    return {
+        'name': component_name,
+        'type': export_type,
+        'exports': exports['names'],
+        'type_exports': exports['types'],
+        'reexports_all': exports['star'],
+        'imports': exports['imports'],
+        'truncated': False
+    }
+
+
+def looks_minified(head):
+    """파일 앞부분이 줄바꿈 없이 길게 이어지면 압축(minified)된 파일로 봄"""
+    return len(head) >= MINIFIED_PROBE_BYTES and b'\n' not in head
+
+
+def read_and_classify(file_path, filename, byte_budget=0, skip_minified=True):
+    """파일을 읽어 (mtime_ns, size, hash, 컴포넌트 정보, 측정값) 반환 (워커 프로세스에서도 호출됨)
+
+    측정값은 (읽은 바이트, 읽기+해시 시간, 판별 시간) 입니다.
+    byte_budget(0이면 무제한)까지만 분석하고 해시도 그 범위에 대해서만 계산합니다.
+    큰 파일은 mmap으로 열어 통째로 메모리에 올리지 않습니다.
+    압축된 파일이면 None을 반환해 결과에서 빠집니다.
+    """
+    started = time.perf_counter()
+    try:
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            limit = stat.st_size if byte_budget <= 0 else min(stat.st_size, byte_budget)
+
+            if limit > MMAP_THRESHOLD_BYTES:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = f.read(limit)
+
             try:
-                # 파일 내용 생성
-                content = []
-                
-                if export_style == "named":
-                    # Named exports 스타일
-                    for comp in sorted(files, key=lambda x: x['component_name']):
-                        file_path = os.path.splitext(comp['relative_path'])[0]
-                        if comp['export_type'] == 'default':
-                            content.append(f"export {{ default as {comp['component_name']} }} from './{file_path}'")
-                        else:
-                            content.append(f"export {{ {comp['component_name']} }} from './{file_path}'")
-                
-                elif export_style == "reexport":
-                    # Re-export 스타일
-                    for comp in sorted(files, key=lambda x: x['relative_path']):
-                        file_path = os.path.splitext(comp['relative_path'])[0]
-                        content.append(f"export * from './{file_path}'")
-                
-                # 파일 쓰기
-                with open(index_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(content))
-                
-                created_files.append(index_path)
-                
-            except Exception as e:
-                error_files.append((index_path, str(e)))
-        
-        # 결과 메시지
-        messages = []
-        if created_files:
-            messages.append(f"✅ {len(created_files)}개 파일이 성공적으로 생성되었습니다:")
-            for file in created_files:
-                messages.append(f"   - {file}")
-        
-        if skipped_files:
-            messages.append(f"\n⏭️ {len(skipped_files)}개 파일이 건너뛰어졌습니다:")
-            for file in skipped_files:
-                messages.append(f"   - {file}")
-        
-        if error_files:
-            messages.append(f"\n❌ {len(error_files)}개 파일에서 오류가 발생했습니다:")
-            for file, error in error_files:
-                messages.append(f"   - {file}: {error}")
-        
-        if messages:
-            # 설정 저장
-            self.config["use_typescript"] = self.use_typescript.get()
-            self.config["export_style"] = self.export_style.get()
-            self.save_config()
-            
-            result_message = '\n'.join(messages)
-            if error_files:
-                messagebox.showerror("완료 (오류 포함)", result_message)
+                if skip_minified and looks_minified(content[:MINIFIED_PROBE_BYTES]):
+                    return None
+
+                digest = hashlib.sha1()
+                with memoryview(content) as view, view[:limit] as scanned:
+                    digest.update(scanned)
+                read_done = time.perf_counter()
+                info = classify_content(content, filename, limit)
+                classify_done = time.perf_counter()
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+    except:
+        return None
+
+    info['truncated'] = limit < stat.st_size
+    stats = (limit, read_done - started, classify_done - read_done)
+    return stat.st_mtime_ns, stat.st_size, digest.hexdigest(), info, stats
+
+
+def encode_index(content):
+    """Index 파일 내용을 디스크에 쓸 바이트로 변환 (텍스트 모드 쓰기와 같은 줄바꿈)"""
+    return content.replace('\n', os.linesep).encode('utf-8')
+
+
+def read_bytes(path):
+    """파일 내용을 바이트로 읽기 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_file_atomic(path, data):
+    """같은 폴더의 임시 파일에 쓴 뒤 rename으로 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+    directory = os.path.dirname(path) or os.curdir
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        else:
+            os.chmod(temp_path, 0o666 & ~current_umask())
+        os.replace(temp_path, path)
+    except:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def current_umask():
+    """현재 프로세스의 umask"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def compile_globs(patterns):
+    """glob 패턴 목록을 정규식 하나로 컴파일 (패턴이 없으면 None)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+
+def gitignore_regex(pattern):
+    """.gitignore 패턴 하나를 정규식 문자열로 변환 (ignore 파일이 있는 폴더 기준 상대 경로용)"""
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    parts = [] if anchored else ['(?:.*/)?']
+
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end < 0:
+                parts.append(re.escape(c))
             else:
-                messagebox.showinfo("완료", result_message)
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body[0] == '!':
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
         else:
-            messagebox.showwarning("경고", "생성된 파일이 없습니다.")
-    
-    def generate_index_file(self):
-        """이전 버전과의 호환성을 위해 남겨둠 - 단일 폴더용"""
-        if not self.selected_folders:
-            messagebox.showerror("오류", "폴더를 선택해주세요.")
+            parts.append(re.escape(c))
+        i += 1
+
+    return '(?s:' + ''.join(parts) + r')\Z'
+
+
+class IgnoreRules:
+    """.gitignore/.ignore 파일 하나의 규칙
+
+    base 폴더 기준 상대 경로('/' 구분)로 매칭하며, git처럼 마지막으로 맞는 규칙이 이깁니다.
+    """
+
+    def __init__(self, base, lines):
+        self.base = base
+        self.rules = []  # (정규식, 부정(!) 여부, 폴더 전용 여부)
+
+        for line in lines:
+            line = line.rstrip('\n').rstrip('\r')
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+            if not line or line.startswith('#'):
+                continue
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            self.rules.append((gitignore_regex(line), negate, dir_only))
+
+        # 대부분의 경로는 어떤 규칙에도 맞지 않으므로 한 번의 매칭으로 걸러냄
+        self.any_pattern = re.compile('|'.join(regex for regex, _, _ in self.rules)) if self.rules else None
+        self.rules = [(re.compile(regex), negate, dir_only) for regex, negate, dir_only in self.rules]
+
+    def match(self, relative_path, is_dir):
+        """무시 대상이면 True, '!'로 다시 포함되면 False, 맞는 규칙이 없으면 None"""
+        if self.any_pattern is None or not self.any_pattern.match(relative_path):
+            return None
+        for pattern, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if pattern.match(relative_path):
+                return not negate
+        return None
+
+
+def load_ignore_rules(path, base):
+    """ignore 파일을 읽어 IgnoreRules 생성 (읽을 수 없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return IgnoreRules(base, f.readlines())
+    except OSError:
+        return None
+
+
+class FileInfo:
+    """스캔 결과 한 항목 (file_info['키']로 읽는 읽기 전용 매핑)
+
+    파일이 많은 폴더를 오래 띄워 두는 GUI/감시 프로세스의 메모리를 줄이기 위해
+    dict 대신 __slots__를 쓰고, 폴더와 디렉터리 문자열은 intern해서 같은 객체를 공유하며
+    relative_path와 file_path는 읽을 때 만듭니다. exports 등의 목록은 스캔 캐시의 항목을 그대로 가리킵니다.
+    """
+
+    __slots__ = ('folder', 'directory', 'filename', 'component_name', 'export_type',
+                 'exports', 'type_exports', 'reexports_all', 'imports', 'truncated')
+    KEYS = ('file_path', 'relative_path', 'filename', 'component_name', 'export_type', 'exports',
+            'type_exports', 'reexports_all', 'imports', 'truncated', 'directory', 'folder')
+    KEY_SET = frozenset(KEYS)
+
+    def __init__(self, folder, relative_path, filename, component_info):
+        self.folder = sys.intern(folder)
+        self.directory = sys.intern(os.path.dirname(relative_path))
+        self.filename = sys.intern(filename)
+        self.component_name = sys.intern(component_info['name'])
+        self.export_type = sys.intern(component_info['type'])
+        self.exports = component_info['exports']
+        self.type_exports = component_info['type_exports']
+        self.reexports_all = component_info['reexports_all']
+        self.imports = component_info.get('imports', ())
+        self.truncated = component_info['truncated']
+
+    @property
+    def relative_path(self):
+        return os.path.join(self.directory, self.filename)
+
+    @property
+    def file_path(self):
+        return os.path.join(self.folder, self.directory, self.filename)
+
+    def __getitem__(self, key):
+        if key not in self.KEY_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.KEY_SET
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.KEY_SET else default
+
+    def rebased(self):
+        """디렉터리를 폴더 쪽으로 옮긴 사본 (relative_path가 파일명이 되고 file_path는 같음, 트리 barrel용)"""
+        copy = object.__new__(FileInfo)
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        copy.folder = os.path.join(self.folder, self.directory)
+        copy.directory = ''
+        return copy
+
+    def keys(self):
+        return self.KEYS
+
+    def __repr__(self):
+        return f"FileInfo({self.file_path!r}, {self.component_name!r})"
+
+
+def relative_path_key(file_info):
+    """상대 경로 정렬 키 (re-export 스타일, import 맵)"""
+    return file_info.relative_path
+
+
+def component_name_key(file_info):
+    """컴포넌트 이름 정렬 키 (named/lazy 스타일)"""
+    return file_info.component_name
+
+
+def file_info_key(file_info):
+    """렌더링 결과에 영향을 주는 값들 (변경 여부 비교용)"""
+    return (file_info['relative_path'], file_info['component_name'], file_info['export_type'],
+            tuple(file_info['exports']), tuple(file_info['type_exports']), file_info['reexports_all'])
+
+
+class JobCancelled(Exception):
+    """cancel 이벤트가 설정되어 스캔이 중단됨 (스캔 결과와 캐시는 이전 상태로 남음)"""
+
+
+def resolve_workers(workers, executor):
+    """설정된 워커 수 해석 (0 이하면 CPU 수에 맞춰 자동)"""
+    if workers and workers > 0:
+        return workers
+    cpu_count = os.cpu_count() or 1
+    if executor == "process":
+        return cpu_count
+    return min(32, cpu_count + 4)
+
+
+class ScanCache:
+    """파일별 (mtime, size, hash) -> {name, type} 을 저장하는 디스크 캐시
+
+    mtime과 size가 그대로면 파일을 열지 않고, 달라졌더라도 내용 해시가 같으면
+    다시 분석하지 않습니다. file_extensions, 분석 설정(options)이나 추출 규칙 버전이
+    바뀌면 전체를 버립니다.
+    """
+
+    def __init__(self, cache_file, file_extensions, options=None):
+        self.cache_file = cache_file
+        self.file_extensions = list(file_extensions)
+        self.options = options or {}  # 분석 결과에 영향을 주는 설정 (바뀌면 캐시 무효화)
+        self.entries = {}  # 절대 경로 -> [mtime_ns, size, hash, 컴포넌트 정보]
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """캐시 파일 로드 (형식이나 규칙이 다르면 비운 채로 시작)"""
+        if not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except:
             return
-            
-        # 첫 번째 선택된 폴더만 처리 (이전 버전 호환성)
-        folder = self.selected_folders[0] if self.selected_folders else None
-        if not folder or not os.path.exists(folder):
-            messagebox.showerror("오류", "유효한 폴더를 선택해주세요.")
+
+        if (data.get('version') != CACHE_FORMAT_VERSION
+                or data.get('rules_version') != EXTRACTION_RULES_VERSION
+                or data.get('file_extensions') != self.file_extensions
+                or data.get('options', {}) != self.options):
+            self.dirty = True
             return
-        
-        if not hasattr(self, 'component_files') or folder not in self.component_files:
-            messagebox.showerror("오류", "먼저 파일을 스캔해주세요.")
+
+        self.entries = data.get('files', {})
+
+    def save(self):
+        """변경이 있을 때만 캐시 파일 저장"""
+        if not self.dirty:
             return
-        
-        extension = '.ts' if self.use_typescript.get() else '.js'
-        index_filename = f"index{extension}"
-        index_path = os.path.join(folder, index_filename)
-        
-        # 기존 파일이 있으면 확인
-        if os.path.exists(index_path):
-            if not messagebox.askyesno("확인", f"{index_filename} 파일이 이미 존재합니다. 덮어쓰시겠습니까?"):
-                return
-        
+
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'rules_version': EXTRACTION_RULES_VERSION,
+            'file_extensions': self.file_extensions,
+            'options': self.options,
+            'files': self.entries
+        }
+        temp_file = f"{self.cache_file}.tmp"
         try:
-            content = self.preview_text.get(1.0, tk.END).strip()
-            # 첫 번째 폴더의 내용만 추출
-            lines = content.split('\n')
-            folder_content = []
-            in_target_folder = False
-            
-            for line in lines:
-                if line.startswith('// =========================================='):
-                    in_target_folder = True
-                    continue
-                elif line.startswith('// ==========================================') and in_target_folder:
-                    break
-                elif in_target_folder and line.strip():
-                    folder_content.append(line)
-            
-            final_content = '\n'.join(folder_content) if folder_content else content
-            
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(final_content)
-            
-            # 설정 저장
-            self.config["use_typescript"] = self.use_typescript.get()
-            self.config["export_style"] = self.export_style.get()
-            self.save_config()
-            
-            messagebox.showinfo("완료", f"{index_path}에 Index 파일이 생성되었습니다.")
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"파일 생성 중 오류가 발생했습니다: {str(e)}")
-    
-    def run(self):
-        """프로그램 실행"""
-        self.root.mainloop()
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+        except:
+            pass
 
-if __name__ == "__main__":
-    app = IndexFileGenerator()
-    app.run()
\ No newline at end of file
+    def reset_stats(self):
+        """hit/miss 카운터 초기화"""
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, file_path):
+        """mtime과 size가 그대로인 파일의 캐시된 정보 반환 (파일을 열지 않음, 없으면 None)"""
+        entry = self.entries.get(os.path.abspath(file_path))
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        if entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self.hits += 1
+            return entry[3]
+        return None
+
+    def store(self, file_path, analyzed):
+        """read_and_classify 결과를 캐시에 반영하고 컴포넌트 정보 반환"""
+        mtime_ns, size, digest, info = analyzed[:4]
+        key = os.path.abspath(file_path)
+        entry = self.entries.get(key)
+
+        if entry and entry[2] == digest:
+            # 내용은 그대로이고 mtime만 바뀐 경우
+            self.hits += 1
+            info = entry[3]
+        else:
+            self.misses += 1
+
+        self.entries[key] = [mtime_ns, size, digest, info]
+        self.dirty = True
+        return info
+
+    def prune(self, folder, seen):
+        """폴더 아래에서 이번 스캔에 보이지 않은(삭제된) 파일 항목 제거"""
+        prefix = os.path.join(os.path.abspath(folder), '')
+        stale = [key for key in self.entries if key.startswith(prefix) and key not in seen]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+
+class Profiler:
+    """스캔 → 렌더링 → 쓰기 단계별 소요 시간과 가장 느린 파일을 모으는 측정기
+
+    read/classify 시간은 워커별 시간의 합이므로 병렬 스캔에서는 analyze 단계의
+    벽시계 시간보다 클 수 있습니다.
+    """
+
+    def __init__(self, top=10):
+        self.top = top
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """측정값 초기화 (스캔을 새로 시작할 때 호출)"""
+        self.phases = {}  # 단계 이름 -> [누적 초, 호출 횟수]
+        self.started = {}
+        self.files = 0
+        self.bytes_read = 0
+        self.read_seconds = 0.0
+        self.classify_seconds = 0.0
+        self.slowest = []  # (초, 경로) 최소 힙
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록의 소요 시간을 name 단계에 누적 (여러 스레드에서 동시에 써도 됨)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def start(self, name):
+        self.started[name] = time.perf_counter()
+
+    def stop(self, name):
+        started = self.started.pop(name, None)
+        if started is not None:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        with self.lock:
+            totals = self.phases.setdefault(name, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    def record_file(self, file_path, bytes_read, read_seconds, classify_seconds):
+        """새로 분석한 파일 하나의 측정값 기록"""
+        self.files += 1
+        self.bytes_read += bytes_read
+        self.read_seconds += read_seconds
+        self.classify_seconds += classify_seconds
+
+        item = (read_seconds + classify_seconds, file_path)
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, item)
+        else:
+            heapq.heappushpop(self.slowest, item)
+
+    def as_dict(self):
+        """JSON으로 저장할 수 있는 측정 결과"""
+        return {
+            'phases': {name: {'seconds': seconds, 'calls': calls} for name, (seconds, calls) in self.phases.items()},
+            'files': self.files,
+            'bytes_read': self.bytes_read,
+            'read_seconds': self.read_seconds,
+            'classify_seconds': self.classify_seconds,
+            'slowest_files': [{'path': path, 'seconds': seconds} for seconds, path in sorted(self.slowest, reverse=True)]
+        }
+
+    def format_report(self):
+        """사람이 읽을 수 있는 측정 결과 줄 목록"""
+        lines = ["단계별 소요 시간:"]
+        for name, (seconds, calls) in self.phases.items():
+            lines.append(f"  {name:<13} {seconds * 1000:10.2f} ms  ({calls}회)")
+
+        rate = self.bytes_read / self.read_seconds / (1024 * 1024) if self.read_seconds else 0
+        lines.append(f"새로 분석한 파일 {self.files}개, {self.bytes_read / 1024:.1f} KiB 읽음 ({rate:.1f} MiB/s)")
+        lines.append(f"  읽기+해시 합계 {self.read_seconds * 1000:.2f} ms, Export 판별 합계 {self.classify_seconds * 1000:.2f} ms")
+
+        if self.slowest:
+            lines.append(f"가장 느린 파일 {len(self.slowest)}개:")
+            for seconds, file_path in sorted(self.slowest, reverse=True):
+                lines.append(f"  {seconds * 1000:8.2f} ms  {file_path}")
+        return lines
+
+
+def is_index_file(file_info):
+    """확장자와 관계없이 index 파일(barrel)인지
+
+    다른 확장자의 index('./index')를 재export하면 생성할 barrel 자신으로 해석되고, 하위 폴더의 index는
+    같은 폴더의 파일들을 이미 직접 재export하므로 barrel에 넣지 않습니다.
+    """
+    return os.path.splitext(file_info['filename'])[0] == 'index'
+
+
+def exported_symbols(file_info):
+    """Named 스타일 Index에 나가는 (이름, 종류) 목록 (종류: 'default', 'named', 'type')"""
+    symbols = []
+    if file_info['export_type'] == 'default' and file_info['component_name'] not in file_info['exports']:
+        symbols.append((file_info['component_name'], 'default'))
+    symbols.extend((name, 'named') for name in file_info['exports'])
+    symbols.extend((name, 'type') for name in file_info['type_exports'])
+    return symbols
+
+
+def is_component_name(name):
+    """React 컴포넌트로 볼 수 있는 이름인지 (PascalCase, 모두 대문자인 상수 제외)"""
+    return re.match(r'^[A-Z][A-Za-z0-9]*$', name) is not None and not name.isupper()
+
+
+def lazy_wrapper(alias, module, name, loader):
+    """lazy 스타일 래퍼 한 줄 (name이 None이면 default export)
+
+    /* @__PURE__ */ 표시로 쓰지 않는 래퍼는 번들러가 지울 수 있습니다.
+    """
+    if loader == "next":
+        target = f"import('{module}')" if name is None else f"import('{module}').then((module) => module.{name})"
+        return f"export const {alias} = /* @__PURE__ */ dynamic(() => {target})"
+    target = f"import('{module}')" if name is None else f"import('{module}').then((module) => ({{ default: module.{name} }}))"
+    return f"export const {alias} = /* @__PURE__ */ lazy(() => {target})"
+
+
+def is_barrel_symbol(name, kind, export_style, extension):
+    """(이름, 종류)가 export_style barrel에 실제로 나가는지
+
+    re-export 스타일은 default를 내보내지 않고, .js Index는 type export를 내보내지 않으며,
+    lazy 스타일은 컴포넌트 이름만 내보냅니다.
+    """
+    if kind == 'type':
+        return extension == '.ts'
+    if export_style == 'reexport':
+        return kind != 'default'
+    if export_style == 'lazy':
+        return is_component_name(name)
+    return True
+
+
+def barrel_depth(directory):
+    """트리 모드 barrel 디렉터리의 깊이 (폴더 자신은 0)"""
+    return directory.count(os.sep) + 1 if directory else 0
+
+
+def extension_rank(file_info, extension_order):
+    """file_extensions 안에서 파일 확장자의 순위 (없으면 맨 뒤)"""
+    extension = os.path.splitext(file_info['filename'])[1]
+    return extension_order.index(extension) if extension in extension_order else len(extension_order)
+
+
+def directory_prefix(directory):
+    """상대 디렉터리를 이름 앞에 붙일 PascalCase 접두사로 변환 (atoms/form-controls -> AtomsFormControls)"""
+    return ''.join(part[:1].upper() + part[1:] for part in re.split(r'[-_./\\ ]+', directory) if part)
+
+
+class SymbolIndex:
+    """폴더 하나의 export 이름 -> 그 이름을 내보내는 파일들
+
+    스캔할 때 만들어 두어 이름 하나의 충돌 여부를 dict 조회로 확인합니다.
+    """
+
+    def __init__(self, files=()):
+        self.names = {}  # 이름 -> [(file_info, 종류)]
+        for file_info in files:
+            for name, kind in exported_symbols(file_info):
+                self.names.setdefault(name, []).append((file_info, kind))
+
+    def files(self, name):
+        """name을 내보내는 파일들"""
+        return [file_info for file_info, _ in self.names.get(name, ())]
+
+    def collisions(self, export_style, extension, excluded=()):
+        """flat barrel에 겹쳐 나가는 이름들을 (이름, [(file_info, 종류)]) 목록으로 반환
+
+        barrel에 나가지 않는 이름(is_barrel_symbol), 생성될 Index 파일 자신과
+        excluded(file_path 집합)의 파일은 비교에서 뺍니다.
+        트리 모드는 하위 barrel의 이름까지 합쳐야 하므로 IndexEngine.tree_collisions에서 따로 찾습니다.
+        """
+        found = []
+        for name, entries in self.names.items():
+            if len(entries) < 2:
+                continue
+            group = {}
+            for file_info, kind in entries:
+                if not is_barrel_symbol(name, kind, export_style, extension):
+                    continue
+                if is_index_file(file_info) or file_info['file_path'] in excluded:
+                    continue
+                group.setdefault(file_info['file_path'], (file_info, kind))
+            if len(group) > 1:
+                found.append((name, sorted(group.values(), key=lambda entry: entry[0]['relative_path'])))
+        found.sort(key=lambda collision: collision[0])
+        return found
+
+
+def resolve_collision(entries, name, policy, extension_order):
+    """충돌 하나를 정책에 따라 해결해 {file_path: 새 이름 또는 None(제외)} 반환 (해결할 수 없으면 None)
+
+    prefix: 모든 파일의 이름 앞에 디렉터리를 붙이고 그래도 겹치면 확장자를 덧붙임
+    extension: file_extensions 순서가 가장 앞선 파일 하나만 남김 (같은 순위가 여럿이면 해결 불가)
+    """
+    if policy == "prefix":
+        aliases = {file_info['file_path']: directory_prefix(file_info['directory']) + name for file_info, _ in entries}
+        if len(set(aliases.values())) < len(aliases):
+            aliases = {file_info['file_path']: aliases[file_info['file_path']]
+                       + directory_prefix(os.path.splitext(file_info['filename'])[1]) for file_info, _ in entries}
+        return aliases if len(set(aliases.values())) == len(aliases) else None
+
+    if policy == "extension":
+        best = min(extension_rank(file_info, extension_order) for file_info, _ in entries)
+        winners = [file_info for file_info, _ in entries if extension_rank(file_info, extension_order) == best]
+        if len(winners) > 1:
+            return None
+        return {file_info['file_path']: name if file_info is winners[0] else None for file_info, _ in entries}
+
+    return None
+
+
+def local_exports(file_info):
+    """파일이 직접(재export가 아닌) 내보낸다고 볼 수 있는 이름들 (default는 'default')"""
+    names = set(file_info['exports']) | set(file_info['type_exports'])
+    if file_info['export_type'] == 'default':
+        names.add('default')
+    return names
+
+
+class ModuleGraph:
+    """스캔한 파일들 사이의 import/재export 그래프
+
+    노드는 파일의 절대 경로이고, 생성될 barrel은 확장자를 뺀 index 경로를 노드로 씁니다.
+    같은 위치의 실제 index 파일은 덮어쓸 것이므로 그 노드가 barrel을 대신합니다.
+    파일별 import 목록은 스캔 캐시에 들어 있고, 파일이 바뀌면 그 파일의 간선만 다시 만듭니다.
+    """
+
+    def __init__(self, aliases=None, extensions=()):
+        self.aliases = {prefix: os.path.abspath(target) for prefix, target in (aliases or {}).items()}
+        self.extensions = list(extensions)
+        self.files = {}  # 절대 경로 -> file_info
+        self.stems = {}  # 확장자 뺀 절대 경로 -> 절대 경로 (file_extensions 순서가 앞선 파일)
+        self.barrels = {}  # barrel 노드(확장자 뺀 index 경로) -> 재export하는 노드들
+        self.resolved = {}  # (디렉터리, import 경로) -> 노드 또는 None (파일이 추가/삭제되면 지움)
+        self.out_edges = {}  # 노드 -> [(대상 노드, 'import' 또는 'reexport', 이름 목록)]
+        self.memo = {}  # 분석 이름 -> 결과 (그래프가 바뀌면 지움)
+        self.version = 0
+
+    def reset(self, file_infos):
+        """파일 목록으로 그래프를 새로 만듦"""
+        self.files = {}
+        for file_info in file_infos:
+            self.files[os.path.abspath(file_info['file_path'])] = file_info
+        self.rebuild_stems()
+
+    def update(self, path, file_info):
+        """파일 하나의 변경 반영 (file_info가 None이면 제거)"""
+        exists = path in self.files
+        if file_info is None:
+            self.files.pop(path, None)
+        else:
+            self.files[path] = file_info
+        if exists != (file_info is not None):
+            self.rebuild_stems()
+        else:
+            self.out_edges.pop(path, None)
+            self.changed()
+
+    def rebuild_stems(self):
+        """파일이 추가/삭제되면 경로 해석 결과가 바뀌므로 해석과 간선을 모두 다시 만듦"""
+        def rank(path):
+            extension = os.path.splitext(path)[1]
+            return self.extensions.index(extension) if extension in self.extensions else len(self.extensions)
+
+        self.stems = {}
+        for path in sorted(self.files, key=rank):
+            self.stems.setdefault(os.path.splitext(path)[0], path)
+        self.resolved = {}
+        self.out_edges = {}
+        self.changed()
+
+    def set_barrels(self, barrels):
+        """생성될 barrel들 {barrel 노드: [재export하는 노드]} 지정"""
+        if barrels != self.barrels:
+            self.barrels = barrels
+            self.resolved = {}
+            self.out_edges = {}
+            self.changed()
+
+    def changed(self):
+        self.memo = {}
+        self.version += 1
+
+    def resolve(self, importer, specifier):
+        """import 경로를 노드로 해석 (상대 경로와 path_aliases만, 스캔하지 않은 파일이면 None)"""
+        key = (os.path.dirname(importer), specifier)
+        if key in self.resolved:
+            return self.resolved[key]
+
+        base = None
+        if specifier in (os.curdir, os.pardir) or specifier.startswith(('./', '../')):
+            base = os.path.normpath(os.path.join(key[0], specifier))
+        else:
+            for prefix, target in self.aliases.items():
+                if specifier.startswith(prefix):
+                    base = os.path.normpath(os.path.join(target, specifier[len(prefix):]))
+                    break
+
+        node = None
+        if base is not None:
+            if base in self.files and os.path.splitext(base)[0] not in self.barrels:
+                node = base
+            else:
+                for candidate in (base, os.path.join(base, 'index')):
+                    if candidate in self.barrels:
+                        node = candidate
+                        break
+                    if candidate in self.stems:
+                        node = self.stems[candidate]
+                        break
+        self.resolved[key] = node
+        return node
+
+    def edges(self, node):
+        """노드에서 나가는 간선 목록"""
+        edges = self.out_edges.get(node)
+        if edges is None:
+            if node in self.barrels:
+                edges = [(target, 'reexport', [['*', None]]) for target in self.barrels[node]]
+            elif os.path.splitext(node)[0] in self.barrels:
+                edges = []  # 덮어쓸 index 파일
+            else:
+                edges = []
+                for specifier, kind, names in self.files[node].get('imports', ()):
+                    target = self.resolve(node, specifier)
+                    if target is not None:
+                        edges.append((target, kind, names))
+            self.out_edges[node] = edges
+        return edges
+
+    def nodes(self):
+        return list(self.files) + [barrel for barrel in self.barrels if barrel not in self.files]
+
+    def reverse_edges(self):
+        """노드 -> 그 노드를 import/재export하는 노드들"""
+        if 'reverse' not in self.memo:
+            reverse = {}
+            for node in self.nodes():
+                for target, _, _ in self.edges(node):
+                    reverse.setdefault(target, set()).add(node)
+            self.memo['reverse'] = reverse
+        return self.memo['reverse']
+
+    def reaching(self, node):
+        """node로 (간접적으로라도) 이어지는 노드들 (node 자신은 자기 자신을 import할 때만 포함)"""
+        key = ('reaching', node)
+        if key not in self.memo:
+            reverse = self.reverse_edges()
+            found = set()
+            stack = [node]
+            while stack:
+                for source in reverse.get(stack.pop(), ()):
+                    if source not in found:
+                        found.add(source)
+                        stack.append(source)
+            self.memo[key] = found
+        return self.memo[key]
+
+    def cycles(self):
+        """barrel이나 재export가 끼어 있는 순환을 노드 목록들로 반환 (Tarjan SCC)"""
+        if 'cycles' in self.memo:
+            return self.memo['cycles']
+
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = itertools.count()
+
+        for start in sorted(self.nodes()):
+            if start in index:
+                continue
+            index[start] = lowlink[start] = next(counter)
+            stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(self.edges(start)))]
+            while work:
+                node, edges = work[-1]
+                for target, _, _ in edges:
+                    if target not in index:
+                        index[target] = lowlink[target] = next(counter)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self.edges(target))))
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+
+        cycles = []
+        for component in components:
+            members = set(component)
+            if len(component) == 1 and not any(target == component[0] for target, _, _ in self.edges(component[0])):
+                continue
+            if any(member in self.barrels or any(kind == 'reexport' and target in members
+                                                 for target, kind, _ in self.edges(member))
+                   for member in component):
+                cycles.append(component)
+        self.memo['cycles'] = sorted(cycles)
+        return self.memo['cycles']
+
+    def used_exports(self):
+        """노드 -> 다른 파일이 실제로 가져다 쓰는 export 이름들 ('*'면 전부)
+
+        일반 import에서 시작해 barrel과 재export를 따라가며 이름이 처음 정의된 파일까지 표시합니다.
+        """
+        if 'used' in self.memo:
+            return self.memo['used']
+
+        used = {}
+        pending = []
+        for node in self.nodes():
+            for target, kind, names in self.edges(node):
+                if kind == 'import':
+                    pending.extend((target, imported) for imported, _ in names)
+
+        while pending:
+            node, name = pending.pop()
+            names = used.setdefault(node, set())
+            if name in names or '*' in names:
+                continue
+            names.add(name)
+
+            mapped = False
+            stars = []
+            for target, kind, specifiers in self.edges(node):
+                if kind != 'reexport':
+                    continue
+                for imported, exported in specifiers:
+                    if imported == '*' and exported is None:
+                        stars.append(target)
+                    elif name == '*':
+                        pending.append((target, imported))
+                    elif exported == name:
+                        pending.append((target, imported))
+                        mapped = True
+            if name == '*' or (not mapped and (node not in self.files or name not in local_exports(self.files[node]))):
+                pending.extend((target, name) for target in stars)
+
+        self.memo['used'] = used
+        return used
+
+
+def barrel_directories(files):
+    """트리 모드의 barrel 구조: ({디렉터리: 직접 있는 파일들}, {디렉터리: 하위 barrel 디렉터리들})
+
+    각 디렉터리의 index 파일은 barrel 자신이므로 빼고, 파일이 있는 디렉터리와 그 모든 상위 디렉터리가 barrel이 됩니다.
+    """
+    by_directory = {}
+    for comp in files:
+        if is_index_file(comp):
+            continue
+        by_directory.setdefault(comp['directory'], []).append(comp)
+
+    children = {}
+    for directory in list(by_directory):
+        while directory:
+            parent = os.path.dirname(directory)
+            children.setdefault(parent, set()).add(directory)
+            directory = parent
+    return by_directory, children
+
+
+class IndexEngine:
+    """GUI 없이 동작하는 Index 파일 생성 엔진"""
+
+    def __init__(self, config=None, cache_file=None):
+        self.config = load_config() if config is None else config
+        self.component_files = {}  # 폴더별로 컴포넌트 파일들을 저장
+        self.skip_pattern = compile_globs(self.config.get("skip_files", []))
+        self.include_pattern = compile_globs(self.config.get("include_globs", []))
+        # '/'가 있는 폴더 패턴은 경로 끝부분과 맞춰보도록 앞에 */를 붙임
+        self.exclude_pattern = compile_globs(['*/' + pattern.strip('/') if '/' in pattern.strip('/') else pattern.strip('/')
+                                              for pattern in self.config.get("exclude_globs", [])])
+        self.ignore_stacks = {}  # 폴더 절대 경로 -> 적용되는 IgnoreRules 목록 (스캔마다 초기화)
+        self.ignore_files = {}  # ignore 파일 경로 -> ((mtime_ns, size), IgnoreRules)
+        self.cache = ScanCache(cache_file, self.config["file_extensions"], self.analysis_options()) if cache_file else None
+        self.profiler = Profiler()
+        self.fingerprints = {}  # 폴더 -> 렌더링에 쓰이는 파일 값들의 튜플 (스캔 결과가 바뀌면 지움)
+        self.render_memo = {}  # (폴더, 스타일, 확장자, barrel 모드, 충돌 정책) -> (fingerprint, 렌더링 결과)
+        self.symbols = {}  # 폴더 -> SymbolIndex
+        self.usage_files = {}  # usage_folders 폴더 -> import만 읽은 파일들
+        self.graph = ModuleGraph(self.config.get("path_aliases", {}), self.config["file_extensions"])
+
+    def analysis_options(self):
+        """파일 분석 결과에 영향을 주는 설정값"""
+        return {
+            'scan_byte_budget': self.config.get("scan_byte_budget", 0),
+            'skip_minified': self.config.get("skip_minified", True)
+        }
+
+    def scan_files(self, folders, progress=None, cancel=None):
+        """선택된 모든 폴더에서 컴포넌트 파일들 스캔
+
+        파일 탐색 후 분석은 scan_workers/scan_executor 설정에 따른 워커 풀에서 실행하며,
+        결과는 탐색 순서대로 합쳐지므로 직렬 실행과 같은 결과가 나옵니다.
+        progress(done, total)는 파일 하나를 분석할 때마다 호출됩니다.
+        cancel(threading.Event)이 설정되면 JobCancelled를 발생시키고 이전 스캔 결과를 그대로 둡니다.
+        """
+        if self.cache:
+            self.cache.reset_stats()
+        self.profiler.reset()
+        self.ignore_stacks = {}
+
+        # 1단계: 폴더별 후보 파일 탐색 (겹치는 폴더는 한 번만 탐색)
+        candidates = {}
+        self.usage_files = {}
+        with self.profiler.phase('walk'):
+            folders = [folder for folder in folders if os.path.exists(folder)]
+            usage_folders = self.usage_folders(folders)
+            walked = self.walk_folders(folders + usage_folders)
+            for folder in folders + usage_folders:
+                candidates[folder] = self.discover_files(folder, walked[folder])
+        if cancel is not None and cancel.is_set():
+            raise JobCancelled()
+
+        # 2단계: 모든 폴더의 파일을 한 번에 분석 (여러 폴더에 걸친 파일은 한 번만)
+        items = {}
+        for files in candidates.values():
+            for file_path, _, filename in files:
+                items.setdefault(os.path.abspath(file_path), (file_path, filename))
+        infos = dict(zip(items, self.analyze_files(list(items.values()), progress, cancel)))
+
+        component_files = {}
+        for folder, files in candidates.items():
+            folder_files = []
+            for file_path, relative_path, filename in files:
+                component_info = infos[os.path.abspath(file_path)]
+                if component_info:
+                    folder_files.append(FileInfo(folder, relative_path, filename, component_info))
+            if folder in usage_folders:
+                self.usage_files[folder] = folder_files
+            else:
+                component_files[folder] = folder_files
+
+            if self.cache:
+                self.cache.prune(folder, {os.path.abspath(file_path) for file_path, _, _ in files})
+
+        if self.cache:
+            with self.profiler.phase('cache_save'):
+                self.cache.save()
+
+        self.component_files = component_files
+        self.fingerprints = {}
+        self.symbols = {folder: SymbolIndex(files) for folder, files in component_files.items()}
+        with self.profiler.phase('graph'):
+            self.graph.reset(self.graph_files())
+        return self.component_files
+
+    def remove_folder(self, folder):
+        """스캔 결과에서 한 폴더만 제거 (다른 폴더는 다시 스캔하지 않음)"""
+        self.component_files.pop(folder, None)
+        self.fingerprints.pop(folder, None)
+        self.symbols.pop(folder, None)
+        self.graph.reset(self.graph_files())
+
+    def usage_folders(self, folders):
+        """설정의 usage_folders 중 실제로 있고 선택한 폴더와 겹치지 않는 폴더들"""
+        return [folder for folder in self.config.get("usage_folders", [])
+                if os.path.exists(folder) and folder not in folders]
+
+    def graph_files(self):
+        """ModuleGraph에 들어가는 파일들 (선택한 폴더와 usage_folders)"""
+        return [file_info for files in itertools.chain(self.component_files.values(), self.usage_files.values())
+                for file_info in files]
+
+    def discover_files(self, folder, walked=None):
+        """한 폴더에서 확장자가 맞는 파일들을 (file_path, relative_path, filename) 목록으로 반환
+
+        walked에 walk_files 결과를 주면 다시 탐색하지 않고 그 목록을 씁니다.
+        """
+        if walked is None:
+            walked = self.walk_files(folder)
+        return [(os.path.join(folder, relative_path), relative_path, filename)
+                for relative_path, filename in walked
+                if self.is_included(relative_path) and not self.is_skipped(relative_path)]
+
+    def walk_files(self, folder):
+        """folder 아래에서 확장자와 ignore 규칙을 통과한 파일들을 (상대 경로, 파일명) 목록으로 반환
+
+        제외 폴더는 dirs에서 빼서 os.walk가 아예 내려가지 않게 합니다.
+        """
+        found = []
+        use_gitignore = self.config.get("use_gitignore", True)
+
+        for root, dirs, files in os.walk(folder):
+            if use_gitignore:
+                # 목록에 이미 있는 이름으로 ignore 파일 존재 여부를 판단 (stat 생략)
+                rules = self.ignore_rules(root, dirs + files)
+                absolute_root = os.path.abspath(root)
+            dirs[:] = self.filter_dirs(root, dirs)
+
+            relative_root = os.path.relpath(root, folder)
+            for file in files:
+                if self.matches_extension(file):
+                    if use_gitignore and rules and self.is_ignored(rules, absolute_root, file, False):
+                        continue
+                    found.append((file if relative_root == os.curdir else os.path.join(relative_root, file), file))
+
+        return found
+
+    def walk_folders(self, folders):
+        """폴더들의 walk_files 결과를 {폴더: 목록}으로 반환
+
+        다른 폴더 안에 있는 폴더는 따로 탐색하지 않고 상위 폴더의 탐색 결과에서 잘라 씁니다.
+        (상위 폴더 탐색에서 제외되는 위치에 있으면 따로 탐색)
+        """
+        absolute = {folder: os.path.abspath(folder) for folder in folders}
+        # 상위 폴더가 먼저 오도록 경로 길이순으로 처리
+        ordered = sorted(folders, key=lambda folder: len(absolute[folder]))
+        walked = {}
+        roots = []  # (절대 경로, 폴더)
+
+        for folder in ordered:
+            for root_path, root in roots:
+                if absolute[folder] == root_path:
+                    walked[folder] = walked[root]
+                    break
+                if absolute[folder].startswith(os.path.join(root_path, '')) and self.is_reachable(root, folder):
+                    prefix = os.path.join(os.path.relpath(absolute[folder], root_path), '')
+                    walked[folder] = [(relative_path[len(prefix):], filename)
+                                      for relative_path, filename in walked[root]
+                                      if relative_path.startswith(prefix)]
+                    break
+            else:
+                walked[folder] = self.walk_files(folder)
+                roots.append((absolute[folder], folder))
+
+        return walked
+
+    def is_reachable(self, root, folder):
+        """root를 탐색할 때 folder까지 내려가는지 (중간 폴더가 제외되지 않는지) 확인"""
+        relative = os.path.relpath(folder, root)
+        if relative == os.curdir:
+            return True
+        directory = root
+        for part in relative.split(os.sep):
+            if part == os.pardir or not self.filter_dirs(directory, [part]):
+                return False
+            directory = os.path.join(directory, part)
+        return True
+
+    def filter_dirs(self, root, dirs):
+        """탐색할 하위 폴더만 남기기 (exclude_globs, .gitignore/.ignore)"""
+        exclude = self.exclude_pattern
+        if self.config.get("use_gitignore", True):
+            rules = self.ignore_rules(root)
+            absolute_root = os.path.abspath(root)
+        else:
+            rules = None
+
+        kept = []
+        for d in dirs:
+            if exclude is not None and (exclude.match(d) or exclude.match('/' + os.path.join(root, d).replace(os.sep, '/'))):
+                continue
+            if rules and self.is_ignored(rules, absolute_root, d, True):
+                continue
+            kept.append(d)
+        return kept
+
+    def ignore_rules(self, directory, names=None):
+        """directory에 적용되는 IgnoreRules 목록 (git 저장소 루트부터 directory까지 순서대로)
+
+        names는 directory 안의 파일/폴더 이름 목록이며, 없으면 stat으로 확인합니다.
+        """
+        directory = os.path.abspath(directory)
+        stack = self.ignore_stacks.get(directory)
+        if stack is not None:
+            return stack
+
+        if names is None:
+            names = [name for name in IGNORE_FILES + ('.git',) if os.path.exists(os.path.join(directory, name))]
+        parent = os.path.dirname(directory)
+        if '.git' in names:
+            # 저장소 루트: 상위 폴더 규칙은 보지 않고 .git/info/exclude가 가장 낮은 우선순위
+            stack = []
+            rules = self.cached_ignore_rules(os.path.join(directory, '.git', 'info', 'exclude'), directory)
+            if rules:
+                stack.append(rules)
+        elif parent == directory:
+            stack = []
+        else:
+            stack = list(self.ignore_rules(parent))
+
+        for name in IGNORE_FILES:
+            if name in names:
+                rules = self.cached_ignore_rules(os.path.join(directory, name), directory)
+                if rules:
+                    stack.append(rules)
+
+        self.ignore_stacks[directory] = stack
+        return stack
+
+    def cached_ignore_rules(self, path, base):
+        """ignore 파일을 컴파일해 두고 바뀌었을 때만 다시 읽기"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.ignore_files.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, load_ignore_rules(path, os.path.join(base, '')))
+            self.ignore_files[path] = cached
+        return cached[1]
+
+    def is_ignored(self, rules, absolute_root, name, is_dir):
+        """absolute_root 안의 name이 ignore 규칙에 걸리는지 확인 (깊은 폴더의 규칙이 우선)"""
+        path = os.path.join(absolute_root, name)
+        for ignore in reversed(rules):
+            result = ignore.match(path[len(ignore.base):].replace(os.sep, '/'), is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def matches_extension(self, filename):
+        """스캔 대상 확장자인지 확인"""
+        return any(filename.endswith(ext) for ext in self.config["file_extensions"])
+
+    def is_skipped(self, relative_path):
+        """skip_files 패턴(파일명 또는 상대 경로)에 걸리는지 확인"""
+        if self.skip_pattern is None:
+            return False
+        return bool(self.skip_pattern.match(os.path.basename(relative_path))
+                    or self.skip_pattern.match(relative_path.replace(os.sep, '/')))
+
+    def is_included(self, relative_path):
+        """include_globs가 있으면 그 패턴(파일명 또는 상대 경로)에 맞는지 확인"""
+        if self.include_pattern is None:
+            return True
+        return bool(self.include_pattern.match(os.path.basename(relative_path))
+                    or self.include_pattern.match(relative_path.replace(os.sep, '/')))
+
+    def is_scan_target(self, folder, file_path):
+        """폴더 스캔 시 포함될 파일인지 확인 (제외 폴더 아래에 있으면 False)"""
+        root = os.path.dirname(file_path)
+        if not self.is_reachable(folder, root):
+            return False
+        relative_path = os.path.relpath(file_path, folder)
+        if self.config.get("use_gitignore", True):
+            rules = self.ignore_rules(root)
+            if rules and self.is_ignored(rules, os.path.abspath(root), os.path.basename(file_path), False):
+                return False
+        return (self.matches_extension(os.path.basename(file_path))
+                and self.is_included(relative_path)
+                and not self.is_skipped(relative_path)
+                and os.path.isfile(file_path))
+
+    def update_files(self, paths):
+        """변경된 경로들만 다시 분석해 스캔 결과에 반영하고, 결과가 바뀐 폴더 목록 반환
+
+        삭제되거나 이동된 폴더 경로가 오면 그 아래의 모든 파일을 결과에서 제거합니다.
+        usage_folders의 파일은 ModuleGraph에만 반영합니다 (barrel 재생성은 가지치기 결과가 바뀔 때만).
+        """
+        paths = {os.path.abspath(path) for path in paths}
+        affected = []
+        self.ignore_stacks = {}
+        graph_version = self.graph.version
+
+        for folder, folder_files in itertools.chain(self.component_files.items(), self.usage_files.items()):
+            folder_prefix = os.path.join(os.path.abspath(folder), '')
+            relevant = sorted(path for path in paths if path.startswith(folder_prefix))
+            if not relevant:
+                continue
+
+            before = [file_info_key(f) for f in folder_files]
+            removed = set()
+            for path in relevant:
+                # 기존 항목 제거 (폴더 경로면 하위 항목 모두)
+                prefix = os.path.join(path, '')
+                position = None
+                for i in range(len(folder_files) - 1, -1, -1):
+                    file_path = os.path.abspath(folder_files[i]['file_path'])
+                    if file_path == path or file_path.startswith(prefix):
+                        position = i
+                        removed.add(file_path)
+                        del folder_files[i]
+
+                if not self.is_scan_target(folder, path):
+                    continue
+
+                component_info = self.analyze_files([(path, os.path.basename(path))])[0]
+                if component_info:
+                    relative_path = os.path.relpath(path, os.path.abspath(folder))
+                    file_info = FileInfo(folder, relative_path, os.path.basename(path), component_info)
+                    # 수정된 파일은 원래 자리에 두어 순서 유지
+                    folder_files.insert(len(folder_files) if position is None else position, file_info)
+                    self.graph.update(path, file_info)
+                    removed.discard(path)
+
+            for path in removed:
+                self.graph.update(path, None)
+
+            after = [file_info_key(f) for f in folder_files]
+            if before != after and folder in self.component_files:
+                affected.append(folder)
+                self.fingerprints.pop(folder, None)
+                self.symbols[folder] = SymbolIndex(folder_files)
+
+        if self.graph.version != graph_version and self.pruning():
+            # import가 바뀌면 다른 폴더의 barrel에서 빠지는 항목도 바뀔 수 있음
+            affected = [folder for folder, folder_files in self.component_files.items() if folder_files]
+
+        if self.cache:
+            self.cache.save()
+
+        return affected
+
+    def analyze_files(self, items, progress=None, cancel=None):
+        """(file_path, filename) 목록을 분석해 같은 순서의 컴포넌트 정보 목록 반환
+
+        cancel이 설정되면 아직 시작하지 않은 분석을 취소하고 JobCancelled를 발생시킵니다.
+        (이미 분석한 파일은 캐시에 남으므로 다음 스캔이 그만큼 빨라집니다)
+        """
+        total = len(items)
+        results = [None] * total
+        done = 0
+
+        # 캐시에 있는 파일은 워커로 보내지 않음
+        pending = []
+        with self.profiler.phase('cache_lookup'):
+            for i, (file_path, filename) in enumerate(items):
+                info = self.cache.lookup(file_path) if self.cache else None
+                if info:
+                    results[i] = info
+                    done += 1
+                    if progress:
+                        progress(done, total)
+                else:
+                    pending.append(i)
+
+        executor_kind = self.config.get("scan_executor", "thread")
+        workers = resolve_workers(self.config.get("scan_workers", 0), executor_kind)
+        options = self.analysis_options()
+        arguments = (
+            [items[i][0] for i in pending],
+            [items[i][1] for i in pending],
+            itertools.repeat(options['scan_byte_budget']),
+            itertools.repeat(options['skip_minified'])
+        )
+
+        self.profiler.start('analyze')
+        if workers == 1 or len(pending) < 2:
+            analyzed_list = map(read_and_classify, *arguments)
+            executor = None
+        else:
+            if executor_kind == "process":
+                executor = ProcessPoolExecutor(max_workers=workers)
+                analyzed_list = executor.map(read_and_classify, *arguments, chunksize=64)
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+                analyzed_list = executor.map(read_and_classify, *arguments)
+
+        try:
+            # executor.map은 제출 순서대로 결과를 돌려줌
+            for i, analyzed in zip(pending, analyzed_list):
+                if cancel is not None and cancel.is_set():
+                    raise JobCancelled()
+                if analyzed:
+                    results[i] = self.cache.store(items[i][0], analyzed) if self.cache else analyzed[3]
+                    self.profiler.record_file(items[i][0], *analyzed[4])
+                done += 1
+                if progress:
+                    progress(done, total)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+            self.profiler.stop('analyze')
+
+        return results
+
+    def extract_component_info(self, file_path, filename):
+        """파일에서 컴포넌트 정보 추출"""
+        options = self.analysis_options()
+        analyzed = read_and_classify(file_path, filename, options['scan_byte_budget'], options['skip_minified'])
+        return analyzed[3] if analyzed else None
+
+    @property
+    def truncated_files(self):
+        """scan_byte_budget를 넘어 앞부분만 분석된 파일들"""
+        return [f['file_path'] for files in self.component_files.values() for f in files if f['truncated']]
+
+    @property
+    def total_files(self):
+        """스캔된 컴포넌트 파일 총 개수"""
+        return sum(len(files) for files in self.component_files.values())
+
+    def render_index(self, files, export_style, extension='.ts', overrides=None):
+        """한 폴더의 Index 파일 내용 생성 (type export는 .ts Index에만 포함)
+
+        overrides는 이름 충돌 해결과 가지치기 결과 {file_path: {이름: 새 이름 또는 None(제외)} 또는 None(파일 제외)} 입니다.
+        """
+        content = []
+        overrides = overrides or {}
+        # index 파일(barrel)은 다시 스캔되어도 barrel에 넣지 않음 (자기 자신이나 하위 barrel 재export)
+        files = [comp for comp in files if not is_index_file(comp)]
+
+        def specifier(name, alias):
+            return name if alias == name else f"{name} as {alias}"
+
+        if export_style == "named":
+            # Named exports 스타일: 파일이 실제로 export하는 심볼들을 나열
+            for comp in sorted(files, key=component_name_key):
+                if comp['file_path'] in overrides and overrides[comp['file_path']] is None:
+                    continue
+                file_path = os.path.splitext(comp['relative_path'])[0]
+                renamed = overrides.get(comp['file_path'], {})
+                specifiers = []
+                if comp['export_type'] == 'default' and comp['component_name'] not in comp['exports']:
+                    alias = renamed.get(comp['component_name'], comp['component_name'])
+                    if alias:
+                        specifiers.append(f"default as {alias}")
+                specifiers.extend(specifier(name, renamed.get(name, name)) for name in comp['exports']
+                                  if renamed.get(name, name))
+                type_specifiers = [specifier(name, renamed.get(name, name)) for name in comp['type_exports']
+                                   if renamed.get(name, name)]
+
+                if specifiers:
+                    content.append(f"export {{ {', '.join(specifiers)} }} from './{file_path}'")
+                if comp['reexports_all']:
+                    content.append(f"export * from './{file_path}'")
+                if type_specifiers and extension == '.ts':
+                    content.append(f"export type {{ {', '.join(type_specifiers)} }} from './{file_path}'")
+
+        elif export_style == "reexport":
+            # Re-export 스타일
+            for comp in sorted(files, key=relative_path_key):
+                if comp['file_path'] in overrides and overrides[comp['file_path']] is None:
+                    continue
+                file_path = os.path.splitext(comp['relative_path'])[0]
+                content.append(f"export * from './{file_path}'")
+
+                # 겹치는 이름은 명시적으로 다시 export해야 export *끼리의 모호함이 풀림
+                renamed = overrides.get(comp['file_path'])
+                if renamed:
+                    names = [specifier(name, renamed[name]) for name in comp['exports'] if renamed.get(name)]
+                    if names:
+                        content.append(f"export {{ {', '.join(names)} }} from './{file_path}'")
+                    types = [specifier(name, renamed[name]) for name in comp['type_exports'] if renamed.get(name)]
+                    if types and extension == '.ts':
+                        content.append(f"export type {{ {', '.join(types)} }} from './{file_path}'")
+
+        elif export_style == "lazy":
+            # Lazy 스타일: 컴포넌트마다 import()를 감싼 래퍼만 두어 barrel을 불러와도 모듈을 평가하지 않음
+            # 컴포넌트가 아닌 값(훅, 유틸리티)은 barrel에서 빼고 deep import로 가져다 씀
+            loader = self.config.get("lazy_loader", "react")
+            wrappers = []
+            type_lines = []
+            for comp in sorted(files, key=component_name_key):
+                if comp['file_path'] in overrides and overrides[comp['file_path']] is None:
+                    continue
+                file_path = os.path.splitext(comp['relative_path'])[0]
+                renamed = overrides.get(comp['file_path'], {})
+                if comp['export_type'] == 'default' and comp['component_name'] not in comp['exports']:
+                    alias = renamed.get(comp['component_name'], comp['component_name'])
+                    if alias and is_component_name(alias):
+                        wrappers.append(lazy_wrapper(alias, f"./{file_path}", None, loader))
+                for name in comp['exports']:
+                    alias = renamed.get(name, name)
+                    if alias and is_component_name(name):
+                        wrappers.append(lazy_wrapper(alias, f"./{file_path}", name, loader))
+                # type export는 컴파일 때 지워지므로 그대로 재export
+                type_specifiers = [specifier(name, renamed.get(name, name)) for name in comp['type_exports']
+                                   if renamed.get(name, name)]
+                if type_specifiers and extension == '.ts':
+                    type_lines.append(f"export type {{ {', '.join(type_specifiers)} }} from './{file_path}'")
+
+            if wrappers:
+                content.append(LAZY_LOADERS.get(loader, LAZY_LOADERS["react"]))
+                content.extend(wrappers)
+            content.extend(type_lines)
+
+        return '\n'.join(content)
+
+    def render_barrel_tree(self, folder, files, export_style, extension='.ts', changed_paths=None, overrides=None):
+        """하위 폴더마다 barrel을 만들고 부모가 자식 barrel을 재export하는 트리 렌더링
+
+        (폴더 기준 상대 디렉터리, 내용) 목록을 자식이 부모보다 먼저 오는 순서로 반환합니다.
+        changed_paths(절대 경로들)를 주면 바뀐 파일에서 루트까지의 경로에 있는 barrel만 만듭니다.
+        """
+        by_directory, children = barrel_directories(files)
+        directories = set(by_directory) | set(children)
+
+        if changed_paths is not None:
+            folder_abs = os.path.abspath(folder)
+            dirty = set()
+            for path in changed_paths:
+                relative_path = os.path.relpath(os.path.abspath(path), folder_abs)
+                if relative_path == os.curdir or relative_path.startswith(os.pardir):
+                    continue
+                directory = os.path.dirname(relative_path)
+                while True:
+                    dirty.add(directory)
+                    if not directory:
+                        break
+                    directory = os.path.dirname(directory)
+            directories &= dirty
+
+        # export * from으로 이름을 다 알 수 없는 파일이 있는 디렉터리 (하위 barrel을 나열해도 export *가 필요)
+        star_directories = set()
+        if export_style != "lazy":
+            for comp in files:
+                directory = comp['directory']
+                while comp['reexports_all'] and directory not in star_directories:
+                    star_directories.add(directory)
+                    if not directory:
+                        break
+                    directory = os.path.dirname(directory)
+
+        overrides = overrides or {}
+        barrels = []
+        for directory in sorted(directories, key=lambda d: (-barrel_depth(d), d)):
+            direct_files = [comp.rebased() for comp in by_directory.get(directory, [])]
+            parts = []
+            rendered = self.render_index(direct_files, export_style, extension, overrides)
+            if rendered:
+                parts.append(rendered)
+            for child in sorted(children.get(directory, ())):
+                parts.extend(self.render_child_exports(child, overrides.get((directory, child)), extension, overrides,
+                                                       child in star_directories))
+            barrels.append((directory, '\n'.join(parts)))
+
+        return barrels
+
+    def render_child_exports(self, child, mapping, extension, overrides, star):
+        """부모 barrel이 하위 barrel을 재export하는 줄들
+
+        충돌을 해결한 하위 barrel(mapping이 있음)은 export * 대신 이름을 나열해 새 이름을 붙이거나 뺍니다.
+        """
+        module = os.path.basename(child)
+        if mapping is None:
+            return [f"export * from './{module}'"]
+
+        lines = [f"export * from './{module}'"] if star else []
+        values = []
+        types = []
+        for name, (alias, kind, file_path, origin) in sorted(mapping.items()):
+            renamed = overrides.get(file_path, {})
+            if not alias or renamed is None or renamed.get(origin, origin) is None:  # 가지치기로 빠진 이름
+                continue
+            (types if kind == 'type' else values).append(name if alias == name else f"{name} as {alias}")
+        if values:
+            lines.append(f"export {{ {', '.join(values)} }} from './{module}'")
+        if types and extension == '.ts':
+            lines.append(f"export type {{ {', '.join(types)} }} from './{module}'")
+        return lines
+
+    def plan_index_files(self, extension, export_style, folders=None, changed_paths=None, barrel_mode=None):
+        """생성할 (폴더, Index 파일 경로, 내용) 목록을 쓰기 순서대로 반환
+
+        barrel_mode(기본값: 설정)가 "tree"면 하위 폴더마다, "flat"이면 선택한 폴더에 하나씩 만듭니다.
+        """
+        index_filename = f"index{extension}"
+        plan = []
+
+        with self.profiler.phase('render'):
+            self.render_plan(plan, index_filename, extension, export_style, folders, changed_paths,
+                             barrel_mode or self.config.get("barrel_mode"))
+
+        return plan
+
+    def render_plan(self, plan, index_filename, extension, export_style, folders, changed_paths, barrel_mode):
+        """plan_index_files의 렌더링 단계"""
+        for folder, files in self.component_files.items():
+            if not files:  # 빈 폴더는 건너뛰기
+                continue
+            if folders is not None and folder not in folders:
+                continue
+
+            if changed_paths is not None and barrel_mode == "tree":
+                # 감시 모드: 바뀐 경로의 barrel만 렌더링
+                overrides = self.barrel_overrides(folder, files, export_style, extension, barrel_mode)
+                barrels = self.render_barrel_tree(folder, files, export_style, extension, changed_paths, overrides)
+            else:
+                barrels = self.render_folder(folder, files, export_style, extension, barrel_mode)
+            for directory, content in barrels:
+                plan.append((folder, os.path.join(folder, directory, index_filename), content))
+
+            if self.config.get("deep_import_map", False):
+                overrides = self.barrel_overrides(folder, files, export_style, extension, barrel_mode)
+                plan.append((folder, os.path.join(folder, IMPORT_MAP_FILENAME),
+                             self.render_import_map(files, overrides, barrel_mode)))
+            manifest_path = os.path.join(folder, "package.json")
+            if self.config.get("side_effects_free", False) and not os.path.exists(manifest_path):
+                plan.append((folder, manifest_path, json.dumps(SIDE_EFFECTS_MANIFEST, indent=2) + '\n'))
+
+    def render_import_map(self, files, overrides=None, barrel_mode=None):
+        """barrel이 내보내는 이름 -> 폴더 기준 모듈 경로 맵(JSON) 생성
+
+        barrel 대신 모듈을 직접 가리키도록 import를 바꾸는 도구(Next.js modularizeImports 등)에 씁니다.
+        overrides(barrel_overrides 결과)로 barrel과 같은 새 이름을 쓰고 빠진 파일과 이름은 넣지 않습니다.
+        같은 이름은 상대 경로순으로 먼저 오는 파일을 쓰고, 다른 barrel(index 파일)은 건너뜁니다.
+        """
+        overrides = overrides or {}
+
+        def direct_names(comps):
+            names = {}
+            for comp in sorted(comps, key=relative_path_key):
+                renamed = overrides.get(comp['file_path'], {})
+                if renamed is None:
+                    continue
+                module = './' + os.path.splitext(comp['relative_path'])[0].replace(os.sep, '/')
+                for name, _ in exported_symbols(comp):
+                    alias = renamed.get(name, name)
+                    if alias:
+                        names.setdefault(alias, module)
+            return names
+
+        if (barrel_mode or self.config.get("barrel_mode")) != "tree":
+            import_map = direct_names(comp for comp in files if not is_index_file(comp))
+        else:
+            # 트리 모드: 하위 barrel이 부모에서 받는 새 이름을 따라 루트 barrel의 이름까지 올라감
+            by_directory, children = barrel_directories(files)
+            exported = {}
+            for directory in sorted(set(by_directory) | set(children), key=lambda d: (-barrel_depth(d), d)):
+                names = direct_names(by_directory.get(directory, ()))
+                for child in sorted(children.get(directory, ())):
+                    mapping = overrides.get((directory, child))
+                    for name, module in exported[child].items():
+                        alias = mapping[name][0] if mapping and name in mapping else name
+                        if alias:
+                            names.setdefault(alias, module)
+                exported[directory] = names
+            import_map = exported.get('', {})
+        return json.dumps(dict(sorted(import_map.items())), indent=2, ensure_ascii=False) + '\n'
+
+    def render_folder(self, folder, files, export_style, extension, barrel_mode):
+        """한 폴더의 barrel들을 (상대 디렉터리, 내용) 목록으로 렌더링
+
+        결과는 (폴더, 파일 목록 fingerprint, 스타일, 확장자, barrel 모드)별로 기억해 두므로
+        옵션을 바꿨다 되돌리거나 미리보기 뒤에 생성할 때는 입력이 바뀐 폴더만 다시 렌더링합니다.
+        가지치기를 켜면 ModuleGraph가 바뀔 때마다 다시 렌더링합니다.
+        """
+        fingerprint = self.fingerprints.get(folder)
+        if fingerprint is None:
+            fingerprint = self.fingerprints[folder] = tuple(file_info_key(f) for f in files)
+
+        key = (folder, export_style, extension, barrel_mode, self.config.get("collision_policy", "warn"),
+               self.config.get("lazy_loader", "react") if export_style == "lazy" else None,
+               self.export_graph(barrel_mode).version if self.pruning() else None)
+        cached = self.render_memo.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        overrides = self.barrel_overrides(folder, files, export_style, extension, barrel_mode)
+        if barrel_mode == "tree":
+            barrels = self.render_barrel_tree(folder, files, export_style, extension, overrides=overrides)
+        else:
+            barrels = [('', self.render_index(files, export_style, extension, overrides))]
+        self.render_memo[key] = (fingerprint, barrels)
+        return barrels
+
+    def barrel_overrides(self, folder, files, export_style, extension, barrel_mode):
+        """충돌 해결과 가지치기를 합친 render_index용 overrides"""
+        overrides = self.collision_overrides(folder, export_style, extension, barrel_mode)[0]
+        if self.pruning():
+            self.prune_overrides(folder, files, export_style, barrel_mode, overrides)
+        return overrides
+
+    def pruning(self):
+        return self.config.get("prune_cycles", False) or self.config.get("prune_unused", False)
+
+    def export_graph(self, barrel_mode=None):
+        """생성될 barrel까지 넣은 ModuleGraph (barrel_mode 기본값: 설정)"""
+        tree_mode = (barrel_mode or self.config.get("barrel_mode")) == "tree"
+        barrels = {}
+        for folder, files in self.component_files.items():
+            if not files:
+                continue
+            root = os.path.abspath(folder)
+            if tree_mode:
+                by_directory, children = barrel_directories(files)
+                for directory in set(by_directory) | set(children):
+                    barrels[os.path.join(root, directory, 'index')] = (
+                        [os.path.abspath(comp['file_path']) for comp in by_directory.get(directory, ())]
+                        + [os.path.join(root, child, 'index') for child in sorted(children.get(directory, ()))])
+            else:
+                barrels[os.path.join(root, 'index')] = [os.path.abspath(comp['file_path']) for comp in files
+                                                        if not is_index_file(comp)]
+
+        # barrel이 자기 위치의 index 파일을 재export하면 자기 자신을 가리키는 순환
+        for barrel, targets in barrels.items():
+            barrels[barrel] = [os.path.splitext(target)[0] if os.path.splitext(target)[0] in barrels else target
+                               for target in targets]
+        self.graph.set_barrels(barrels)
+        return self.graph
+
+    def graph_node(self, graph, file_info):
+        """file_info에 해당하는 ModuleGraph 노드 (덮어쓸 index 파일이면 barrel 노드)"""
+        path = os.path.abspath(file_info['file_path'])
+        stem = os.path.splitext(path)[0]
+        return stem if stem in graph.barrels else path
+
+    def barrel_chain(self, folder, file_info, barrel_mode):
+        """파일을 내보낼 barrel 노드들 (트리 모드는 상위 barrel 포함)"""
+        tree_mode = (barrel_mode or self.config.get("barrel_mode")) == "tree"
+        root = os.path.abspath(folder)
+        directory = file_info['directory'] if tree_mode else ''
+        barrels = [os.path.join(root, directory, 'index')]
+        while directory:
+            directory = os.path.dirname(directory)
+            barrels.append(os.path.join(root, directory, 'index'))
+        return barrels
+
+    def cycle_exports(self, graph, folder, file_info, barrel_mode):
+        """파일에서 자신을 내보낼 barrel로 import가 이어지면 다른 파일이 그 barrel을 통해 쓰는 export 이름들 (순환이 아니면 None)"""
+        barrels = self.barrel_chain(folder, file_info, barrel_mode)
+        node = self.graph_node(graph, file_info)
+        if not any(node in graph.reaching(barrel) for barrel in barrels):
+            return None
+
+        used = graph.used_exports()
+        names = set().union(*(used.get(barrel, ()) for barrel in barrels))
+        symbols = [name for name, _ in exported_symbols(file_info)]
+        if '*' in names:
+            return set(symbols)
+        return {name for name in symbols if name in names}
+
+    def prune_overrides(self, folder, files, export_style, barrel_mode, overrides):
+        """prune_cycles/prune_unused 설정에 따라 barrel에서 뺄 파일과 이름을 overrides에 추가
+
+        prune_cycles: 파일에서 자신을 내보낼 barrel(트리 모드는 상위 barrel 포함)로 import가 이어지면
+        barrel을 통해 쓰이지 않는 이름을 제외 (하나도 안 쓰이면 파일 제외, 쓰이는 이름은 남기고 find_unpruned_cycles로 보고)
+        prune_unused: 선택한 폴더와 usage_folders의 어떤 파일도 쓰지 않는 이름 제외 (모두 안 쓰면 파일 제외)
+        """
+        graph = self.export_graph(barrel_mode)
+        used = graph.used_exports() if self.config.get("prune_unused", False) else None
+
+        for file_info in files:
+            node = self.graph_node(graph, file_info)
+            if self.config.get("prune_cycles", False):
+                needed = self.cycle_exports(graph, folder, file_info, barrel_mode)
+                if needed is not None and not needed:
+                    overrides[file_info['file_path']] = None
+                    continue
+                if needed is not None and export_style != "reexport":
+                    renamed = overrides.setdefault(file_info['file_path'], {})
+                    for name, _ in exported_symbols(file_info):
+                        if name not in needed:
+                            renamed[name] = None
+
+            if used is None or file_info['file_path'] in overrides and overrides[file_info['file_path']] is None:
+                continue
+            names = used.get(node, set())
+            if '*' in names:
+                continue
+            symbols = exported_symbols(file_info)
+            unused = [name for name, kind in symbols if ('default' if kind == 'default' else name) not in names]
+            if not unused:
+                continue
+            if len(unused) == len(symbols) and (export_style == "reexport" or not file_info['reexports_all']):
+                overrides[file_info['file_path']] = None
+            elif export_style != "reexport":
+                renamed = overrides.setdefault(file_info['file_path'], {})
+                for name in unused:
+                    renamed[name] = None
+
+    def find_unpruned_cycles(self, barrel_mode=None):
+        """prune_cycles로도 뺄 수 없는 순환 파일들 - 다른 파일이 barrel을 통해 쓰는 이름이 있어 남겨 둔 (파일 경로, [이름]) 목록"""
+        graph = self.export_graph(barrel_mode)
+        found = []
+        for folder, files in self.component_files.items():
+            for file_info in files:
+                if is_index_file(file_info):
+                    continue
+                needed = self.cycle_exports(graph, folder, file_info, barrel_mode)
+                if needed:
+                    found.append((file_info['file_path'], sorted(needed)))
+        found.sort()
+        return found
+
+    def find_cycles(self, barrel_mode=None):
+        """barrel이 끼어 있는 import 순환들을 경로 목록으로 반환 (barrel은 확장자 없는 index 경로)"""
+        return [[os.path.relpath(node) for node in cycle] for cycle in self.export_graph(barrel_mode).cycles()]
+
+    def find_unused_exports(self, barrel_mode=None):
+        """선택한 폴더의 파일마다 어디서도 import하지 않는 export를 (파일 경로, [이름]) 목록으로 반환"""
+        graph = self.export_graph(barrel_mode)
+        used = graph.used_exports()
+        found = []
+        seen = set()
+        for files in self.component_files.values():
+            for file_info in files:
+                node = self.graph_node(graph, file_info)
+                if node in seen or node in graph.barrels:
+                    continue
+                seen.add(node)
+                names = used.get(node, set())
+                if '*' in names:
+                    continue
+                unused = sorted(name for name in local_exports(file_info) if name not in names)
+                if unused:
+                    found.append((file_info['file_path'], unused))
+        found.sort()
+        return found
+
+    def symbol_index(self, folder):
+        """폴더의 SymbolIndex (스캔 때 만든 것이 없으면 지금 만듦)"""
+        index = self.symbols.get(folder)
+        if index is None:
+            index = self.symbols[folder] = SymbolIndex(self.component_files.get(folder, ()))
+        return index
+
+    def collision_overrides(self, folder, export_style, extension, barrel_mode=None):
+        """collision_policy로 폴더의 충돌을 해결해 (overrides, 충돌 목록) 반환
+
+        충돌 목록 항목은 (디렉터리, 이름, [(file_info, 종류)], 해결 여부)입니다.
+        확장자만 다른 같은 경로의 파일들(use-toast.ts와 use-toast.tsx)은 같은 모듈 경로('./use-toast')로
+        렌더링되어 번들러가 하나만 찾으므로 이름별로 풀지 않고 파일 전체의 충돌로 봅니다.
+        "extension" 정책이면 file_extensions 순서가 앞선 파일만 남기고, 다른 정책에서는 해결하지 못한 충돌입니다.
+        """
+        policy = self.config.get("collision_policy", "warn")
+        order = self.config["file_extensions"]
+        tree_mode = (barrel_mode or self.config.get("barrel_mode")) == "tree"
+        files = [file_info for file_info in self.component_files.get(folder, ()) if not is_index_file(file_info)]
+        overrides = {}
+        found = []
+
+        # 같은 모듈 경로로 렌더링되는 파일들
+        modules = {}
+        for file_info in files:
+            modules.setdefault(os.path.splitext(file_info['relative_path'])[0], []).append(file_info)
+        excluded = set()
+        for module, group in sorted(modules.items()):
+            if len(group) < 2:
+                continue
+            group.sort(key=lambda file_info: (extension_rank(file_info, order), file_info['filename']))
+            resolved = policy == "extension" and extension_rank(group[0], order) < extension_rank(group[1], order)
+            specifier = './' + (os.path.basename(module) if tree_mode else module).replace(os.sep, '/')
+            found.append((os.path.dirname(module) if tree_mode else '', specifier,
+                          [(file_info, 'module') for file_info in group], resolved))
+            for file_info in group[1:]:
+                # 해결하지 못했으면 그대로 렌더링되지만 같은 충돌을 이름마다 다시 보고하지 않음
+                excluded.add(file_info['file_path'])
+                if resolved:
+                    overrides[file_info['file_path']] = None
+
+        if tree_mode:
+            self.tree_collisions([file_info for file_info in files if file_info['file_path'] not in excluded],
+                                 export_style, extension, policy, overrides, found)
+        else:
+            for name, entries in self.symbol_index(folder).collisions(export_style, extension, excluded):
+                aliases = resolve_collision(entries, name, policy, order)
+                found.append(('', name, entries, aliases is not None))
+                for file_path, alias in (aliases or {}).items():
+                    overrides.setdefault(file_path, {})[name] = alias
+
+        found.sort(key=lambda collision: (collision[0], collision[1]))
+        return overrides, found
+
+    def tree_collisions(self, files, export_style, extension, policy, overrides, found):
+        """트리 모드: barrel마다 직접 있는 파일과 하위 barrel이 내보내는 이름을 합쳐 아래에서부터 충돌 해결
+
+        부모 barrel은 하위 barrel을 export *로 합치므로 형제 폴더끼리 겹치는 이름은 부모에서만 보입니다.
+        직접 있는 파일의 새 이름은 overrides[file_path]에, 하위 barrel의 이름은
+        overrides[(디렉터리, 하위 디렉터리)] = {하위 barrel의 이름: (새 이름 또는 None, 종류, file_path, 파일의 원래 이름)}에
+        넣으며, 이 항목이 있는 하위 barrel은 export * 대신 이름을 나열해 재export합니다.
+        """
+        order = self.config["file_extensions"]
+        by_directory, children = barrel_directories(files)
+        exported = {}  # 디렉터리 -> {barrel이 내보내는 이름: (file_info, 종류, 파일의 원래 이름)}
+
+        for directory in sorted(set(by_directory) | set(children), key=lambda d: (-barrel_depth(d), d)):
+            entries = {}  # 이름 -> [(file_info, 종류, 원래 이름, 하위 디렉터리 또는 None)]
+            for comp in by_directory.get(directory, ()):
+                for name, kind in exported_symbols(comp):
+                    if is_barrel_symbol(name, kind, export_style, extension):
+                        entries.setdefault(name, []).append((comp, kind, name, None))
+            for child in sorted(children.get(directory, ())):
+                for name, (comp, kind, origin) in exported[child].items():
+                    entries.setdefault(name, []).append((comp, kind, origin, child))
+
+            names = {}
+            child_names = {child: {} for child in children.get(directory, ())}
+            involved = set()  # 해결한 충돌에 낀 하위 barrel (이름을 나열해야 export *끼리의 모호함이 풀림)
+            for name, group in sorted(entries.items()):
+                aliases = None
+                if len(group) > 1:
+                    group.sort(key=lambda entry: entry[0]['relative_path'])
+                    aliases = resolve_collision([(comp, kind) for comp, kind, _, _ in group], name, policy, order)
+                    found.append((directory, name, [(comp, kind) for comp, kind, _, _ in group], aliases is not None))
+                    if aliases:
+                        involved.update(child for _, _, _, child in group if child is not None)
+                for comp, kind, origin, child in group:
+                    alias = aliases[comp['file_path']] if aliases else name
+                    if child is None:
+                        if aliases:
+                            overrides.setdefault(comp['file_path'], {})[name] = alias
+                    else:
+                        child_names[child][name] = (alias, kind, comp['file_path'], origin)
+                    if alias:
+                        names.setdefault(alias, (comp, kind, origin))
+
+            for child in involved:
+                overrides[(directory, child)] = child_names[child]
+            exported[directory] = names
+
+    def find_collisions(self, extension, export_style, folders=None, barrel_mode=None):
+        """스캔한 폴더들의 이름 충돌 목록
+
+        항목마다 {'folder', 'index_path', 'name', 'files', 'resolved'}를 반환하며
+        resolved는 collision_policy로 해결되었는지 여부입니다.
+        """
+        found = []
+        for folder in self.component_files:
+            if folders is not None and folder not in folders:
+                continue
+            for directory, name, entries, resolved in self.collision_overrides(folder, export_style, extension, barrel_mode)[1]:
+                found.append({
+                    'folder': folder,
+                    'index_path': os.path.join(folder, directory, f"index{extension}"),
+                    'name': name,
+                    'files': [file_info['relative_path'] for file_info, _ in entries],
+                    'resolved': resolved
+                })
+        return found
+
+    def collision_errors(self, extension, export_style, folders=None, barrel_mode=None):
+        """쓰지 않을 Index 파일 -> 오류 메시지 (collision_policy가 "warn"이 아닐 때 해결하지 못한 충돌)"""
+        if self.config.get("collision_policy", "warn") == "warn":
+            return {}
+        messages = {}
+        for collision in self.find_collisions(extension, export_style, folders, barrel_mode):
+            if not collision['resolved']:
+                messages.setdefault(collision['index_path'], []).append(
+                    f"이름 충돌 {collision['name']}: {', '.join(collision['files'])}")
+        return {index_path: '; '.join(lines) for index_path, lines in messages.items()}
+
+    def render_preview(self, export_style, extension='.ts'):
+        """여러 폴더의 Index 파일 미리보기 생성"""
+        all_previews = []
+        tree_mode = self.config.get("barrel_mode") == "tree"
+
+        with self.profiler.phase('preview'):
+            plan = self.plan_index_files(extension, export_style)
+
+        for folder, index_path, content in plan:
+            if tree_mode or os.path.basename(index_path) != f"index{extension}":
+                # 트리 모드는 barrel이 많으므로, Index가 아닌 파일(import 맵, package.json)은 구분되도록 경로 표시
+                content = f"// {os.path.relpath(index_path, os.path.dirname(folder))}\n{content}"
+            all_previews.append(content)
+
+        return '\n\n'.join(all_previews)
+
+    def diff_index_files(self, extension, export_style, folders=None, with_diff=True, barrel_mode=None):
+        """파일을 쓰지 않고 생성될 Index 파일과 디스크의 파일 비교
+
+        파일마다 {'path', 'status', 'diff'} 를 반환하며 status는
+        'unchanged', 'changed', 'missing', 'collision'(해결하지 못한 이름 충돌) 중 하나입니다.
+        """
+        errors = self.collision_errors(extension, export_style, folders, barrel_mode)
+        plan = [entry for entry in self.plan_index_files(extension, export_style, folders, barrel_mode=barrel_mode)
+                if entry[1] not in errors]
+        entries = self.diff_plan(plan, with_diff)
+        entries.extend({'path': index_path, 'status': 'collision', 'diff': message} for index_path, message in errors.items())
+        return entries
+
+    def diff_plan(self, plan, with_diff=True):
+        """plan_index_files 결과를 디스크의 파일과 비교 (diff_index_files 참고)"""
+        entries = []
+
+        for folder, index_path, content in plan:
+            existing = read_bytes(index_path)
+            if existing == encode_index(content):
+                entries.append({'path': index_path, 'status': 'unchanged', 'diff': ''})
+                continue
+
+            diff = ''
+            if with_diff:
+                old_lines = existing.decode('utf-8', 'replace').splitlines(True) if existing is not None else []
+                new_lines = content.splitlines(True)
+                # 마지막 줄에 줄바꿈이 없으면 diff 출력이 이어 붙지 않도록 보정
+                if old_lines and not old_lines[-1].endswith(('\n', '\r')):
+                    old_lines[-1] += '\n'
+                if new_lines and not new_lines[-1].endswith('\n'):
+                    new_lines[-1] += '\n'
+                diff = ''.join(difflib.unified_diff(
+                    old_lines, new_lines,
+                    fromfile=index_path if existing is not None else '/dev/null',
+                    tofile=index_path
+                ))
+
+            entries.append({
+                'path': index_path,
+                'status': 'missing' if existing is None else 'changed',
+                'diff': diff
+            })
+
+        return entries
+
+    def generate_index_files(self, extension, export_style, confirm_overwrite=None, folders=None, changed_paths=None):
+        """스캔된 모든 폴더에 Index 파일들 생성
+
+        confirm_overwrite(folder, index_path)는 기존 파일이 있을 때 호출되며
+        True(덮어쓰기), False(건너뛰기), None(전체 작업 중단)을 반환합니다.
+        지정하지 않으면 항상 덮어씁니다. folders를 주면 그 폴더들만 생성하고,
+        트리 모드에서 changed_paths를 주면 바뀐 경로의 상위 barrel들만 생성합니다.
+        """
+        plan, errors = self.prepare_index_files(extension, export_style, folders, changed_paths)
+        result = self.write_plan(plan, confirm_overwrite)
+        result['errors'].extend(errors.items())
+        return result
+
+    def prepare_index_files(self, extension, export_style, folders=None, changed_paths=None):
+        """쓸 Index 파일 계획과 충돌 때문에 쓰지 않을 파일의 오류 메시지를 (plan, {경로: 메시지})로 반환"""
+        errors = self.collision_errors(extension, export_style, folders)
+        plan = [entry for entry in self.plan_index_files(extension, export_style, folders, changed_paths)
+                if entry[1] not in errors]
+        return plan, errors
+
+    def overwrite_conflicts(self, plan):
+        """plan 중 디스크에 다른 내용의 파일이 이미 있는 (폴더, Index 파일 경로) 목록
+
+        덮어쓸지를 한 번에 묻고 그 답을 write_plan의 confirm_overwrite로 넘길 때 씁니다.
+        """
+        conflicts = []
+        for folder, index_path, content in plan:
+            existing = read_bytes(index_path)
+            if existing is not None and existing != encode_index(content):
+                conflicts.append((folder, index_path))
+        return conflicts
+
+    def write_plan(self, plan, confirm_overwrite=None, progress=None, cancel=None):
+        """plan_index_files 결과를 디스크에 쓰고 결과 dict 반환 (내용이 같은 파일은 건너뜀)
+
+        progress(done, total, index_path, status)는 파일 하나를 처리할 때마다 호출되며
+        status는 'created', 'unchanged', 'skipped', 'error' 중 하나입니다.
+        cancel이 설정되면 남은 파일을 쓰지 않고 cancelled를 True로 반환합니다.
+        """
+        result = {
+            'created': [],
+            'unchanged': [],
+            'skipped': [],
+            'errors': [],
+            'cancelled': False
+        }
+
+        for done, (folder, index_path, content) in enumerate(plan, 1):
+            if cancel is not None and cancel.is_set():
+                result['cancelled'] = True
+                break
+            status = self.write_entry(result, folder, index_path, content, confirm_overwrite)
+            if status is None:
+                break
+            if progress:
+                progress(done, len(plan), index_path, status)
+
+        return result
+
+    def write_entry(self, result, folder, index_path, content, confirm_overwrite):
+        """write_plan의 파일 하나 처리 - 결과를 result에 넣고 상태 반환 (전체 작업 중단이면 None)"""
+        data = encode_index(content)
+
+        # 내용이 같으면 쓰지 않음 (mtime을 건드리면 번들러 watcher가 다시 빌드함)
+        with self.profiler.phase('write'):
+            existing = read_bytes(index_path)
+        if existing == data:
+            result['unchanged'].append(index_path)
+            return 'unchanged'
+
+        # 기존 파일이 있는지 확인
+        if confirm_overwrite is not None and existing is not None:
+            response = confirm_overwrite(folder, index_path)
+
+            if response is None:  # 취소
+                result['cancelled'] = True
+                return None
+            elif response is False:  # 건너뛰기
+                result['skipped'].append(index_path)
+                return 'skipped'
+            # response is True일 때는 덮어쓰기 진행
+
+        try:
+            with self.profiler.phase('write'):
+                write_file_atomic(index_path, data)
+            result['created'].append(index_path)
+            return 'created'
+
+        except Exception as e:
+            result['errors'].append((index_path, str(e)))
+            return 'error'
+
+
+class PollingWatcher:
+    """주기적으로 파일 mtime/size를 비교하는 감시기 (inotify를 쓸 수 없을 때 사용)"""
+
+    def __init__(self, engine, folders, interval=1.0):
+        self.engine = engine
+        self.folders = list(folders)
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self):
+        """감시 대상 파일들의 (mtime_ns, size) 스냅샷"""
+        snapshot = {}
+        for folder in self.folders:
+            for file_path, _, _ in self.engine.discover_files(folder):
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                snapshot[os.path.abspath(file_path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        """timeout초 안에 바뀐 파일 경로들 반환 (없으면 빈 집합)"""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self.take_snapshot()
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify로 폴더 트리를 감시 (ctypes로 libc 직접 호출)"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, engine, folders):
+        import ctypes
+        import ctypes.util
+
+        self.engine = engine
+        self.folders = list(folders)
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self.watches = {}  # watch descriptor -> 폴더 경로
+        for folder in self.folders:
+            self.add_tree(folder)
+
+    def add_tree(self, directory):
+        """폴더와 (제외 폴더를 뺀) 모든 하위 폴더에 감시 등록"""
+        for root, dirs, _ in os.walk(os.path.abspath(directory)):
+            dirs[:] = self.engine.filter_dirs(root, dirs)
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root), self.WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = root
+
+    def wait(self, timeout):
+        """timeout초 안에 바뀐 경로들 반환 (큐가 넘치면 None: 전체 재스캔 필요)"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if self.engine.filter_dirs(directory, [name]):
+                        # 새 폴더는 감시를 등록하고 안에 이미 있는 파일들도 변경으로 처리
+                        self.add_tree(path)
+                        for root, dirs, files in os.walk(path):
+                            dirs[:] = self.engine.filter_dirs(root, dirs)
+                            changed.update(os.path.join(root, file) for file in files)
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changed.add(path)
+            elif self.engine.matches_extension(name):
+                changed.add(path)
+
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(engine, folders, use_polling=False, poll_interval=1.0):
+    """가능하면 inotify, 아니면 폴링 감시기 생성"""
+    if not use_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(engine, folders)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(engine, folders, poll_interval)
+
+
+def watch_folders(engine, folders, extension, export_style, debounce=0.3,
+                  use_polling=False, poll_interval=1.0, report=print):
+    """폴더들을 감시하며 바뀐 파일만 다시 분석하고 영향받은 Index 파일만 다시 생성
+
+    이벤트가 몰려 올 때는 debounce초 동안 조용해질 때까지 모은 뒤 한 번에 처리합니다.
+    Ctrl+C로 종료할 때까지 돌아갑니다.
+    """
+    folders = [folder for folder in folders if os.path.isdir(folder)]
+    index_filename = f"index{extension}"
+    tree_mode = engine.config.get("barrel_mode") == "tree"
+    # 감시기가 직접 쓰는 Index 파일 이벤트는 무시 (자기 자신을 다시 깨우지 않도록)
+    own_outputs = {os.path.abspath(os.path.join(folder, index_filename)) for folder in folders}
+
+    def is_own_output(path):
+        if tree_mode:
+            return os.path.basename(path) == index_filename
+        return path in own_outputs
+
+    engine.scan_files(folders)
+    engine.generate_index_files(extension, export_style)
+    # usage_folders는 barrel을 만들지 않지만 import가 바뀌면 ModuleGraph를 갱신해야 하므로 함께 감시
+    watcher = create_watcher(engine, folders + engine.usage_folders(folders), use_polling, poll_interval)
+    report(f"{len(folders)}개 폴더 감시 중 ({type(watcher).__name__}). 종료하려면 Ctrl+C")
+
+    try:
+        while True:
+            changed = watcher.wait(1.0)
+            if changed is not None:
+                changed = {path for path in changed if not is_own_output(path)}
+                if not changed:
+                    continue
+
+            # 디바운스: 이벤트가 멈출 때까지 모으기
+            while changed is not None:
+                more = watcher.wait(debounce)
+                if more is None:
+                    changed = None
+                    break
+                more = {path for path in more if not is_own_output(path)}
+                if not more:
+                    break
+                changed |= more
+
+            if changed is None:
+                report("이벤트가 너무 많아 전체를 다시 스캔합니다.")
+                engine.scan_files(folders)
+                affected = list(engine.component_files)
+            else:
+                graph_version = engine.graph.version
+                affected = engine.update_files(changed)
+                if engine.pruning() and engine.graph.version != graph_version:
+                    # 가지치기 결과는 바뀐 파일이 없는 barrel에도 영향을 주므로 바뀐 경로만이 아니라 폴더 전체를 렌더링
+                    changed = None
+
+            if not affected:
+                continue
+
+            result = engine.generate_index_files(extension, export_style, folders=affected, changed_paths=changed)
+            for index_path in result['created']:
+                report(f"갱신: {index_path}")
+            for index_path, error in result['errors']:
+                report(f"오류: {index_path}: {error}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def format_result_messages(result):
+    """생성 결과를 사람이 읽을 수 있는 메시지 줄로 변환"""
+    messages = []
+    if result['created']:
+        messages.append(f"✅ {len(result['created'])}개 파일이 성공적으로 생성되었습니다:")
+        for file in result['created']:
+            messages.append(f"   - {file}")
+
+    if result['unchanged']:
+        messages.append(f"\n🟰 {len(result['unchanged'])}개 파일은 내용이 같아 그대로 두었습니다:")
+        for file in result['unchanged']:
+            messages.append(f"   - {file}")
+
+    if result['skipped']:
+        messages.append(f"\n⏭️ {len(result['skipped'])}개 파일이 건너뛰어졌습니다:")
+        for file in result['skipped']:
+            messages.append(f"   - {file}")
+
+    if result['errors']:
+        messages.append(f"\n❌ {len(result['errors'])}개 파일에서 오류가 발생했습니다:")
+        for file, error in result['errors']:
+            messages.append(f"   - {file}: {error}")
+
+    if result.get('cancelled'):
+        messages.append("\n⛔ 작업이 중단되어 나머지 파일은 쓰지 않았습니다.")
+
+    if messages:
+        messages.append(f"\n쓰기 {len(result['created'])}, 변경 없음 {len(result['unchanged'])}, "
+                        f"건너뜀 {len(result['skipped'])}, 오류 {len(result['errors'])}")
+
+    return messages
+
+
+def format_collision_warnings(collisions, policy, limit=10):
+    """이름 충돌 목록을 메시지 줄로 변환 (해결된 충돌은 개수만, 미해결 충돌은 warn 정책일 때 limit개까지)"""
+    messages = []
+    resolved = [collision for collision in collisions if collision['resolved']]
+    unresolved = [collision for collision in collisions if not collision['resolved']]
+
+    if resolved:
+        messages.append(f"이름 충돌 {len(resolved)}개를 {policy} 규칙으로 해결했습니다.")
+    if unresolved and policy == "warn":
+        messages.append(f"⚠️ 이름 충돌 {len(unresolved)}개 (collision_policy로 처리 방법을 정할 수 있습니다):")
+        for collision in unresolved[:limit]:
+            messages.append(f"   - {collision['index_path']}: {collision['name']} <- {', '.join(collision['files'])}")
+        if len(unresolved) > limit:
+            messages.append(f"   ... 외 {len(unresolved) - limit}개")
+
+    return messages
+
+
+def format_graph_report(cycles, unused, limit=None):
+    """순환 import와 쓰이지 않는 export 목록을 메시지 줄로 변환 (limit개까지)"""
+    messages = []
+    if cycles:
+        messages.append(f"🔁 barrel이 끼어 있는 순환 import {len(cycles)}개:")
+        for cycle in cycles[:limit]:
+            messages.append(f"   - {' <-> '.join(cycle)}")
+    if unused:
+        messages.append(f"🧹 어디서도 import하지 않는 export가 있는 파일 {len(unused)}개:")
+        for file_path, names in unused[:limit]:
+            messages.append(f"   - {file_path}: {', '.join(names)}")
+    for items in (cycles, unused):
+        if limit is not None and len(items) > limit:
+            messages.append(f"   ... 외 {len(items) - limit}개")
+    return messages
+
+
+def print_check_report(entries, as_json=False, with_diff=False):
+    """--check/--diff 결과 출력"""
+    outdated = [entry for entry in entries if entry['status'] != 'unchanged']
+
+    if as_json:
+        report = {
+            'up_to_date': not outdated,
+            'summary': {status: sum(1 for entry in entries if entry['status'] == status)
+                        for status in ('unchanged', 'changed', 'missing', 'collision')},
+            'files': [
+                {key: value for key, value in entry.items() if with_diff or key != 'diff'}
+                for entry in entries
+            ]
+        }
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    for entry in outdated:
+        if entry['status'] == 'collision':
+            print(f"충돌: {entry['path']}: {entry['diff']}")
+        elif with_diff:
+            sys.stdout.write(entry['diff'])
+        else:
+            label = {'missing': "없음", 'collision': "충돌"}.get(entry['status'], "변경됨")
+            print(f"{label}: {entry['path']}")
+
+    if outdated:
+        print(f"{len(entries)}개 중 {len(outdated)}개 Index 파일이 최신이 아닙니다.", file=sys.stderr)
+    else:
+        print(f"{len(entries)}개 Index 파일이 모두 최신입니다.", file=sys.stderr)
+
+
+def load_manifest(path):
+    """manifest 파일(JSON)에서 target 항목 목록 읽기 ({"targets": [...]} 또는 목록 자체)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get("targets", []) if isinstance(data, dict) else data
+
+
+def resolve_targets(entries, base_dir, defaults):
+    """manifest의 target 항목들을 빠진 값을 채운 dict 목록으로 변환
+
+    각 항목은 폴더 경로 문자열이거나 {"folder", "style", "extension", "barrels", "skip_existing"}
+    dict이며, 빠진 값은 defaults에서 가져옵니다. 상대 경로는 base_dir 기준입니다.
+    잘못된 값이 있으면 ValueError를 발생시킵니다.
+    """
+    targets = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"folder": entry}
+        if not isinstance(entry, dict) or not entry.get("folder"):
+            raise ValueError(f"target에 folder가 없습니다: {entry}")
+
+        target = {
+            'folder': os.path.normpath(os.path.join(base_dir, entry["folder"])),
+            'style': entry.get("style", defaults['style']),
+            'extension': "." + entry.get("extension", defaults['extension']).lstrip('.'),
+            'barrels': entry.get("barrels", defaults['barrels']),
+            'skip_existing': bool(entry.get("skip_existing", defaults['skip_existing']))
+        }
+        if target['style'] not in EXPORT_STYLES:
+            raise ValueError(f"알 수 없는 Export 스타일입니다: {target['style']} ({entry['folder']})")
+        if target['extension'] not in (".ts", ".js"):
+            raise ValueError(f"알 수 없는 확장자입니다: {target['extension']} ({entry['folder']})")
+        if target['barrels'] not in BARREL_MODES:
+            raise ValueError(f"알 수 없는 barrel 모드입니다: {target['barrels']} ({entry['folder']})")
+        targets.append(target)
+
+    return targets
+
+
+def plan_batch(engine, targets):
+    """target별 (생성 계획, 오류 목록) 반환
+
+    앞선 target과 같은 Index 파일을 만들거나 해결하지 못한 이름 충돌이 있는 항목은 오류로 분리합니다.
+    """
+    owners = {}  # Index 파일 절대 경로 -> 처음 만든 target 폴더
+    plans = []
+    for target in targets:
+        plan = []
+        errors = engine.collision_errors(target['extension'], target['style'], [target['folder']], target['barrels'])
+        conflicts = list(errors.items())
+        for entry in engine.plan_index_files(target['extension'], target['style'], [target['folder']],
+                                             barrel_mode=target['barrels']):
+            index_path = os.path.abspath(entry[1])
+            if entry[1] in errors:
+                continue
+            if index_path in owners:
+                conflicts.append((entry[1], f"{owners[index_path]} target과 같은 파일을 생성합니다"))
+            else:
+                owners[index_path] = target['folder']
+                plan.append(entry)
+        plans.append((plan, conflicts))
+    return plans
+
+
+def run_batch(engine, targets, check=False, with_diff=False, as_json=False, report=print):
+    """manifest의 모든 target을 한 번의 스캔(공유 캐시, 겹치는 폴더는 한 번만 탐색)으로 처리
+
+    쓰기는 target별로 스레드 풀에서 동시에 실행하고 마지막에 합친 요약을 출력합니다.
+    종료 코드(0: 성공, 1: 오류 또는 최신이 아님)를 반환합니다.
+    """
+    folders = list(dict.fromkeys(target['folder'] for target in targets))
+    missing = [folder for folder in folders if not os.path.isdir(folder)]
+    for folder in missing:
+        print(f"폴더를 찾을 수 없습니다: {folder}", file=sys.stderr)
+
+    engine.scan_files(folders)
+    # --json 출력은 표준 출력에 JSON만 남도록 스캔 요약을 표준 오류로 보냄
+    summary = (lambda message: print(message, file=sys.stderr)) if as_json else report
+    summary(f"target {len(targets)}개, {len(engine.component_files)}개 폴더에서 총 {engine.total_files}개의 컴포넌트 파일을 찾았습니다.")
+    if engine.cache:
+        summary(f"캐시: {engine.cache.hits}개 적중, {engine.cache.misses}개 새로 분석")
+
+    plans = plan_batch(engine, targets)
+    conflicts = [conflict for _, target_conflicts in plans for conflict in target_conflicts]
+    for index_path, error in conflicts:
+        print(f"충돌: {index_path}: {error}", file=sys.stderr)
+
+    if check or with_diff:
+        entries = []
+        for target, (plan, _) in zip(targets, plans):
+            for entry in engine.diff_plan(plan, with_diff):
+                entry['target'] = target['folder']
+                entries.append(entry)
+        print_check_report(entries, as_json, with_diff)
+        outdated = [entry for entry in entries if entry['status'] != 'unchanged']
+        return 1 if outdated or conflicts or missing else 0
+
+    def write_target(target_plan):
+        target, (plan, target_conflicts) = target_plan
+        confirm_overwrite = (lambda folder, index_path: False) if target['skip_existing'] else None
+        result = engine.write_plan(plan, confirm_overwrite)
+        result['errors'].extend(target_conflicts)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(targets), os.cpu_count() or 1))) as executor:
+        results = list(executor.map(write_target, zip(targets, plans)))
+
+    # 안쪽 target이 쓴 파일은 바깥 target의 스캔 입력이기도 하므로 바깥 target을 다시 계획해 한 번 실행으로 맞춤
+    def contains(outer, inner):
+        return inner != outer and os.path.join(os.path.abspath(inner), '').startswith(os.path.join(os.path.abspath(outer), ''))
+
+    nested_outputs = [path for target, result in zip(targets, results) for path in result['created']
+                      if any(contains(other['folder'], target['folder']) for other in targets)]
+    affected = set(engine.update_files(nested_outputs)) if nested_outputs else set()
+    for target, (plan, _), result in zip(targets, plans, results):
+        if target['folder'] not in affected or target['skip_existing']:
+            continue
+        paths = {index_path for _, index_path, _ in plan}
+        replanned = engine.write_plan([entry for entry in plan_batch(engine, [target])[0][0] if entry[1] in paths])
+        result['created'].extend(path for path in replanned['created'] if path not in result['created'])
+        result['errors'].extend(replanned['errors'])
+
+    total = {key: [] for key in ('created', 'unchanged', 'skipped', 'errors')}
+    for target, result in zip(targets, results):
+        report(f"[{target['folder']}] {target['style']}, {target['extension']}, {target['barrels']}: "
+               f"쓰기 {len(result['created'])}, 변경 없음 {len(result['unchanged'])}, "
+               f"건너뜀 {len(result['skipped'])}, 오류 {len(result['errors'])}")
+        for key in total:
+            total[key].extend(result[key])
+
+    for index_path, error in total['errors']:
+        report(f"   ❌ {index_path}: {error}")
+    for index_path in total['created']:
+        report(f"   ✅ {index_path}")
+    report(f"전체: 쓰기 {len(total['created'])}, 변경 없음 {len(total['unchanged'])}, "
+           f"건너뜀 {len(total['skipped'])}, 오류 {len(total['errors'])}")
+
+    return 1 if total['errors'] or missing else 0
+
+
+def run_gui():
+    """Tk GUI 실행 (tkinter는 이때만 import)"""
+    from index_generator_gui import IndexFileGenerator
+
+    app = IndexFileGenerator()
+    app.run()
+    return 0
+
+
+def build_parser():
+    """명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="python -m index_generator",
+        description="React 컴포넌트 폴더에 Index(barrel) 파일을 생성합니다. 폴더를 지정하지 않으면 GUI를 실행합니다."
+    )
+    parser.add_argument("folders", nargs="*", help="Index 파일을 생성할 폴더들")
+    parser.add_argument("--batch", action="store_true", help="설정 파일의 targets 목록을 한 번에 처리")
+    parser.add_argument("--manifest", metavar="PATH", help="targets 목록이 있는 manifest(JSON) 파일을 한 번에 처리")
+    parser.add_argument("--style", choices=EXPORT_STYLES, help="Export 스타일 (기본값: 설정 파일의 export_style)")
+    parser.add_argument("--barrels", choices=BARREL_MODES, help="flat: 선택한 폴더에 하나, tree: 하위 폴더마다 Index 생성")
+    parser.add_argument("--extension", choices=("ts", "js"), help="Index 파일 확장자 (기본값: 설정 파일의 use_typescript)")
+    parser.add_argument("--config", default=CONFIG_FILE, help=f"설정 파일 경로 (기본값: {CONFIG_FILE})")
+    parser.add_argument("--workers", type=int, help="파일 분석 워커 수 (0: 자동, 1: 직렬)")
+    parser.add_argument("--executor", choices=SCAN_EXECUTORS, help="파일 분석 워커 종류")
+    parser.add_argument("--byte-budget", type=int, help="파일당 분석할 최대 바이트 (0: 무제한)")
+    parser.add_argument("--no-cache", action="store_true", help=f"스캔 캐시({CACHE_FILE}) 사용하지 않기")
+    parser.add_argument("--collisions", choices=COLLISION_POLICIES, help="같은 barrel에 겹치는 이름 처리 방법 (기본값: 설정 파일의 collision_policy)")
+    parser.add_argument("--lazy-loader", choices=tuple(LAZY_LOADERS), help="lazy 스타일의 래퍼 (기본값: 설정 파일의 lazy_loader)")
+    parser.add_argument("--import-map", action="store_true", help=f"선택한 폴더에 이름 -> 모듈 경로 맵({IMPORT_MAP_FILENAME})도 생성")
+    parser.add_argument("--side-effects", action="store_true", help="선택한 폴더에 package.json이 없으면 sideEffects 목록만 있는 package.json 생성")
+    parser.add_argument("--usage", action="append", metavar="FOLDER", help="barrel은 만들지 않고 import만 읽을 폴더 (여러 번 지정 가능, 설정의 usage_folders에 추가)")
+    parser.add_argument("--graph", action="store_true", help="파일을 쓰지 않고 barrel 순환과 쓰이지 않는 export만 출력 (순환이 있으면 종료 코드 1)")
+    parser.add_argument("--prune-cycles", action="store_true", help="barrel을 다시 import하는 파일을 barrel에서 제외")
+    parser.add_argument("--prune-unused", action="store_true", help="어디서도 import하지 않는 export를 barrel에서 제외")
+    parser.add_argument("--skip-existing", action="store_true", help="이미 Index 파일이 있는 폴더는 건너뛰기")
+    parser.add_argument("--check", action="store_true", help="파일을 쓰지 않고 Index 파일이 최신인지만 확인 (다르면 종료 코드 1)")
+    parser.add_argument("--diff", action="store_true", help="파일을 쓰지 않고 생성될 내용과의 unified diff 출력 (다르면 종료 코드 1)")
+    parser.add_argument("--json", action="store_true", help="--check/--diff 결과를 JSON으로 출력")
+    parser.add_argument("--watch", action="store_true", help="폴더를 감시하며 변경될 때마다 Index 파일 갱신")
+    parser.add_argument("--debounce", type=float, default=0.3, help="감시 모드에서 이벤트를 모으는 시간(초)")
+    parser.add_argument("--poll", action="store_true", help="감시 모드에서 inotify 대신 폴링 사용")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="폴링 간격(초)")
+    parser.add_argument("--profile", action="store_true", help="단계별 소요 시간과 가장 느린 파일을 표준 오류로 출력")
+    parser.add_argument("--profile-json", metavar="PATH", help="단계별 측정 결과를 JSON 파일로 저장")
+    parser.add_argument("--cprofile", metavar="PATH", help="cProfile 결과를 저장 (python -m pstats PATH로 확인)")
+    parser.add_argument("--gui", action="store_true", help="Tk GUI 실행")
+    return parser
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    args = build_parser().parse_args(argv)
+
+    batch = args.batch or args.manifest
+    if args.gui or not (args.folders or batch):
+        return run_gui()
+
+    config = load_config(args.config)
+    export_style = args.style or config["export_style"]
+    if args.extension:
+        extension = f".{args.extension}"
+    else:
+        extension = index_extension(config["use_typescript"])
+    if args.barrels:
+        config["barrel_mode"] = args.barrels
+    if args.workers is not None:
+        config["scan_workers"] = args.workers
+    if args.executor:
+        config["scan_executor"] = args.executor
+    if args.byte_budget is not None:
+        config["scan_byte_budget"] = args.byte_budget
+    if args.collisions:
+        config["collision_policy"] = args.collisions
+    if args.lazy_loader:
+        config["lazy_loader"] = args.lazy_loader
+    if args.import_map:
+        config["deep_import_map"] = True
+    if args.side_effects:
+        config["side_effects_free"] = True
+    if args.usage:
+        config["usage_folders"] = config.get("usage_folders", []) + args.usage
+    if args.prune_cycles:
+        config["prune_cycles"] = True
+    if args.prune_unused:
+        config["prune_unused"] = True
+
+    engine = IndexEngine(config, None if args.no_cache else default_cache_file(args.config))
+
+    if batch:
+        if args.folders or args.watch:
+            print("--batch/--manifest는 폴더 인자나 --watch와 함께 쓸 수 없습니다.", file=sys.stderr)
+            return 1
+        defaults = {
+            'style': export_style,
+            'extension': extension,
+            'barrels': config["barrel_mode"],
+            'skip_existing': args.skip_existing
+        }
+        try:
+            if args.manifest:
+                targets = resolve_targets(load_manifest(args.manifest), os.path.dirname(args.manifest), defaults)
+            else:
+                targets = resolve_targets(config.get("targets", []), os.path.dirname(args.config), defaults)
+        except (OSError, ValueError) as e:
+            print(f"manifest를 읽을 수 없습니다: {e}", file=sys.stderr)
+            return 1
+        if not targets:
+            print("처리할 target이 없습니다.", file=sys.stderr)
+            return 1
+
+        def command():
+            return run_batch(engine, targets, args.check, args.diff, args.json)
+    else:
+        missing = [folder for folder in args.folders if not os.path.isdir(folder)]
+        for folder in missing:
+            print(f"폴더를 찾을 수 없습니다: {folder}", file=sys.stderr)
+
+        def command():
+            return run_command(args, engine, extension, export_style, missing)
+
+    if args.cprofile:
+        profile = cProfile.Profile()
+        try:
+            status = profile.runcall(command)
+        finally:
+            profile.dump_stats(args.cprofile)
+    else:
+        status = command()
+
+    if args.profile:
+        print('\n'.join(engine.profiler.format_report()), file=sys.stderr)
+    if args.profile_json:
+        with open(args.profile_json, 'w', encoding='utf-8') as f:
+            json.dump(engine.profiler.as_dict(), f, indent=2, ensure_ascii=False)
+    return status
+
+
+def run_command(args, engine, extension, export_style, missing):
+    """main에서 설정을 적용한 뒤 실제 작업(감시, 확인, 생성) 실행"""
+    if args.watch:
+        watch_folders(engine, args.folders, extension, export_style, args.debounce,
+                      args.poll, args.poll_interval)
+        return 0
+
+    if args.graph:
+        engine.scan_files(args.folders)
+        cycles = engine.find_cycles()
+        messages = format_graph_report(cycles, engine.find_unused_exports())
+        print('\n'.join(messages) if messages else "순환 import와 쓰이지 않는 export가 없습니다.")
+        return 1 if cycles or missing else 0
+
+    if args.check or args.diff:
+        engine.scan_files(args.folders)
+        entries = engine.diff_index_files(extension, export_style, with_diff=args.diff)
+        print_check_report(entries, args.json, args.diff)
+        outdated = [entry for entry in entries if entry['status'] != 'unchanged']
+        return 1 if outdated or missing else 0
+
+    engine.scan_files(args.folders)
+    print(f"{len(engine.component_files)}개 폴더에서 총 {engine.total_files}개의 컴포넌트 파일을 찾았습니다.")
+    if engine.cache:
+        print(f"캐시: {engine.cache.hits}개 적중, {engine.cache.misses}개 새로 분석")
+    for file_path in engine.truncated_files:
+        print(f"분석 한도({engine.config['scan_byte_budget']} 바이트)를 넘어 앞부분만 분석했습니다: {file_path}")
+    for message in format_collision_warnings(engine.find_collisions(extension, export_style), engine.config["collision_policy"]):
+        print(message, file=sys.stderr)
+    cycles = engine.find_cycles()
+    if cycles and not engine.config.get("prune_cycles", False):
+        print(f"⚠️ barrel이 끼어 있는 순환 import {len(cycles)}개 (--graph로 확인, --prune-cycles로 제외)", file=sys.stderr)
+    elif cycles:
+        for file_path, names in engine.find_unpruned_cycles():
+            print(f"⚠️ barrel을 통해 쓰이는 이름({', '.join(names)})이 있어 순환을 끊지 못했습니다: {file_path}", file=sys.stderr)
+
+    confirm_overwrite = (lambda folder, index_path: False) if args.skip_existing else None
+    result = engine.generate_index_files(extension, export_style, confirm_overwrite)
+
+    messages = format_result_messages(result)
+    print('\n'.join(messages) if messages else "생성된 파일이 없습니다.")
+
+    return 1 if result['errors'] or missing else 0
+
+
+def __getattr__(name):
+    """이전 버전과의 호환성: IndexFileGenerator는 접근할 때 GUI 모듈에서 불러옴"""
+    if name == "IndexFileGenerator":
+        from index_generator_gui import IndexFileGenerator
+        return IndexFileGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
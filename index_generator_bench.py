@@ -0,0 +1,374 @@
+"""index_generator 성능 측정 스크립트
+
+사용 예:
+    python index_generator_bench.py parser components lib
+    python index_generator_bench.py generate /tmp/tree --files 10000
+    python index_generator_bench.py suite --sizes 1000 10000 100000 --output bench.json
+    python index_generator_bench.py suite --baseline bench.json   # 이전 결과보다 느려졌으면 종료 코드 1
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from index_generator import DEFAULT_CONFIG, IndexEngine, classify_content, load_config, to_component_name
+
+BENCH_FORMAT_VERSION = 1
+COMPONENT_WORDS = ("button", "card", "modal", "table", "form", "input", "list", "menu", "panel", "badge",
+                   "avatar", "chart", "dialog", "header", "footer", "sidebar", "toast", "tabs", "calendar", "picker")
+NON_COMPONENT_EXTENSIONS = (".css", ".json", ".md", ".svg", ".snap")
+
+
+def legacy_classify(content, filename):
+    """이전 버전의 부분 문자열 검사 방식 (비교 기준)"""
+    component_name = to_component_name(filename)
+
+    if 'export default' in content:
+        export_type = 'default'
+    elif f'export {{' in content or f'export const {component_name}' in content or f'export function {component_name}' in content:
+        export_type = 'named'
+    else:
+        export_type = 'unknown'
+
+    return {
+        'name': component_name,
+        'type': export_type
+    }
+
+
+def load_sources(folders):
+    """폴더들에서 스캔 대상 파일 내용을 메모리로 읽기 (파일 I/O는 측정에서 제외)
+
+    부분 문자열 방식은 디코딩된 문자열을, 토크나이저는 바이트를 그대로 받습니다.
+    """
+    engine = IndexEngine(load_config())
+    sources = []
+    for folder in folders:
+        for file_path, _, filename in engine.discover_files(folder):
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                sources.append((file_path, filename, raw.decode('utf-8'), raw))
+            except:
+                pass
+    return sources
+
+
+def time_classifier(classify, sources, repeat, raw):
+    """classify를 모든 파일에 repeat번 적용한 최소 소요 시간(초)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for source in sources:
+            classify(source[3] if raw else source[2], source[1])
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_parser(folders, repeat=5):
+    """부분 문자열 방식과 토크나이저 방식의 속도와 판별 결과 비교"""
+    sources = load_sources(folders)
+    total_bytes = sum(len(raw) for _, _, _, raw in sources)
+    print(f"파일 {len(sources)}개, {total_bytes / 1024:.1f} KiB, {repeat}회 중 최소값")
+
+    for label, classify, raw in (("substring", legacy_classify, False), ("tokenizer", classify_content, True)):
+        elapsed = time_classifier(classify, sources, repeat, raw)
+        rate = total_bytes / elapsed / (1024 * 1024) if elapsed else 0
+        print(f"  {label:<10} {elapsed * 1000:8.2f} ms  {rate:8.1f} MiB/s")
+
+    # 판별 결과가 다른 파일
+    differences = []
+    for file_path, filename, content, raw in sources:
+        legacy = legacy_classify(content, filename)['type']
+        current = classify_content(raw, filename)
+        if legacy != current['type']:
+            differences.append((file_path, legacy, current['type'], current['exports']))
+
+    print(f"Export 타입이 달라진 파일 {len(differences)}개")
+    for file_path, legacy, current, exports in differences:
+        print(f"  {file_path}: {legacy} -> {current} {exports}")
+
+
+def synthetic_name(rng):
+    """kebab-case 파일 이름 하나 생성"""
+    return '-'.join(rng.sample(COMPONENT_WORDS, rng.randint(1, 3)))
+
+
+def synthetic_source(rng, filename, size):
+    """파일 종류(default/named/mixed/types/reexport/minified)를 골라 대략 size 바이트의 소스 생성"""
+    name = to_component_name(filename)
+    kind = rng.choices(("default", "named", "mixed", "types", "reexport", "minified"),
+                       weights=(40, 25, 15, 10, 8, 2))[0]
+    if kind == "types" and not filename.endswith(('.ts', '.tsx')):
+        kind = "named"
+
+    if kind == "minified":
+        # 줄바꿈 없는 번들 (skip_minified 대상)
+        return ("var a=1;" * max(size // 8, 600) + f"export default {name};").encode()
+
+    lines = ["import React from 'react'", ""]
+    if kind == "default":
+        lines.append(f"export default function {name}({{ children }}) {{")
+    elif kind == "named":
+        lines.append(f"export const {name} = ({{ children }}) => <div>{{children}}</div>")
+        lines.append(f"export function use{name}() {{ return null }}")
+        lines.append(f"function {name}Body({{ children }}) {{")
+    elif kind == "mixed":
+        lines.append(f"const {name}Item = () => null")
+        lines.append(f"export {{ {name}Item, {name}Item as {name}Row }}")
+        lines.append(f"export default function {name}({{ children }}) {{")
+    elif kind == "types":
+        lines.append(f"export interface {name}Props {{ id: string; label?: string }}")
+        lines.append(f"export type {name}Id = string")
+        lines.append(f"export const {name} = (props: {name}Props) => null")
+        lines.append(f"function {name}Body({{ children }}) {{")
+    else:
+        lines.append(f"export * from './{synthetic_name(rng)}'")
+        lines.append(f"export {{ default as {name} }} from './{synthetic_name(rng)}'")
+        lines.append(f"function {name}Body({{ children }}) {{")
+
+    # 본문으로 목표 크기까지 채우기 (문자열, 템플릿, 주석이 섞인 JSX)
+    body = []
+    length = sum(len(line) + 1 for line in lines)
+    while length < size:
+        line = rng.choice((
+            "  const [open, setOpen] = React.useState(false) // 'state'",
+            "  const label = `item-${open ? 'on' : 'off'}`",
+            "  /* export default 주석 안의 문자열은 무시 */",
+            "  const style = { padding: 4, margin: '0 auto' }",
+            "  if (!children) { return null }",
+        ))
+        body.append(line)
+        length += len(line) + 1
+    lines.extend(body)
+    lines.append("  return <div className=\"box\">{children}</div>")
+    lines.append("}")
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def generate_tree(root, files, depth=4, seed=0, non_component=0.2, mean_size=2048):
+    """root 아래에 합성 React 컴포넌트 트리를 만들고 (파일 수, 바이트 수) 반환
+
+    폴더 깊이는 최대 depth이며, 파일 크기는 mean_size 근처의 로그 정규 분포를 따르고
+    non_component 비율만큼은 스캔 대상이 아닌 파일(.css, .json 등)입니다.
+    """
+    rng = random.Random(seed)
+    directories = [""]
+    for _ in range(max(1, files // 20)):
+        parent = rng.choice(directories)
+        if parent.count(os.sep) + 1 >= depth:
+            parent = os.path.dirname(parent)
+        directory = os.path.join(parent, synthetic_name(rng).title().replace('-', ''))
+        if directory not in directories:
+            directories.append(directory)
+
+    total_bytes = 0
+    for i in range(files):
+        directory = os.path.join(root, rng.choice(directories))
+        os.makedirs(directory, exist_ok=True)
+        size = int(min(max(rng.lognormvariate(0, 1) * mean_size / 1.65, 100), 256 * 1024))
+
+        if rng.random() < non_component:
+            filename = f"{synthetic_name(rng)}-{i}{rng.choice(NON_COMPONENT_EXTENSIONS)}"
+            data = b"/* asset */\n" + b"x" * size
+        else:
+            filename = f"{synthetic_name(rng)}-{i}{rng.choice(('.jsx', '.tsx', '.js', '.ts'))}"
+            data = synthetic_source(rng, filename, size)
+
+        with open(os.path.join(directory, filename), 'wb') as f:
+            f.write(data)
+        total_bytes += len(data)
+
+    return files, total_bytes
+
+
+def time_call(function, repeat=1, setup=None):
+    """function을 repeat번 실행한 최소 소요 시간(초)과 마지막 반환값"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_tree(root, work_dir, config, repeat=3):
+    """한 트리에서 cold/warm 스캔, 렌더링, 쓰기 시간을 따로 측정"""
+    cache_file = os.path.join(work_dir, "index_generator_cache.json")
+    seconds = {}
+
+    def remove_cache():
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
+    # cold: 캐시 파일 없이 스캔 (OS 페이지 캐시는 데워진 상태)
+    seconds['cold_scan'], engine = time_call(
+        lambda: scan_with(IndexEngine(dict(config), cache_file), root), repeat, remove_cache)
+    misses = engine.cache.misses
+
+    # warm: 디스크의 캐시를 읽어 새 엔진으로 스캔
+    seconds['warm_scan'], engine = time_call(
+        lambda: scan_with(IndexEngine(dict(config), cache_file), root), repeat)
+    hits = engine.cache.hits
+
+    for mode in ("flat", "tree"):
+        seconds[f'render_{mode}'], _ = time_call(
+            lambda: engine.plan_index_files('.ts', 'named', barrel_mode=mode), repeat, engine.render_memo.clear)
+    seconds['render_memoized'], _ = time_call(lambda: engine.plan_index_files('.ts', 'named', barrel_mode="tree"), repeat)
+
+    # 쓰기: 처음에는 모두 새로 쓰고, 두 번째는 내용이 같아 건너뜀
+    engine.config["barrel_mode"] = "tree"
+    seconds['write'], result = time_call(lambda: engine.generate_index_files('.ts', 'named'))
+    written = len(result['created'])
+    seconds['write_unchanged'], _ = time_call(lambda: engine.generate_index_files('.ts', 'named'))
+
+    return {
+        'component_files': engine.total_files,
+        'cache_misses': misses,
+        'cache_hits': hits,
+        'index_files': written,
+        'seconds': seconds
+    }
+
+
+def scan_with(engine, root):
+    """engine으로 root를 스캔하고 engine 반환 (time_call용)"""
+    engine.scan_files([root])
+    return engine
+
+
+def bench_suite(sizes, depth, seed, non_component, mean_size, repeat, config, keep=None):
+    """크기별 합성 트리를 만들어 측정하고 JSON으로 저장할 결과 dict 반환"""
+    runs = []
+    for files in sizes:
+        work_dir = tempfile.mkdtemp(prefix="index_generator_bench_")
+        root = os.path.join(work_dir, "components")
+        try:
+            started = time.perf_counter()
+            _, total_bytes = generate_tree(root, files, depth, seed, non_component, mean_size)
+            generate_seconds = time.perf_counter() - started
+
+            run = bench_tree(root, work_dir, config, repeat)
+            run.update({'files': files, 'bytes': total_bytes, 'generate_seconds': generate_seconds})
+            runs.append(run)
+
+            print(f"파일 {files}개 ({total_bytes / (1024 * 1024):.1f} MiB, 컴포넌트 {run['component_files']}개)", file=sys.stderr)
+            for label, elapsed in run['seconds'].items():
+                print(f"  {label:<16} {elapsed * 1000:10.2f} ms", file=sys.stderr)
+        finally:
+            if keep:
+                shutil.move(root, os.path.join(keep, f"components-{files}"))
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'version': BENCH_FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {'depth': depth, 'seed': seed, 'non_component': non_component,
+                       'mean_size': mean_size, 'repeat': repeat},
+        'config': {key: config[key] for key in ('scan_workers', 'scan_executor', 'scan_byte_budget', 'skip_minified')},
+        'runs': runs
+    }
+
+
+def compare_results(current, baseline, tolerance):
+    """같은 파일 수의 측정값을 비교해 tolerance 비율보다 느려진 항목 목록 반환"""
+    baseline_runs = {run['files']: run for run in baseline.get('runs', [])}
+    regressions = []
+    for run in current['runs']:
+        previous = baseline_runs.get(run['files'])
+        if previous is None:
+            continue
+        for label, elapsed in run['seconds'].items():
+            before = previous['seconds'].get(label)
+            if not before:
+                continue
+            ratio = elapsed / before
+            marker = " <- 느려짐" if ratio > 1 + tolerance else ""
+            print(f"  {run['files']:>7} {label:<16} {before * 1000:10.2f} -> {elapsed * 1000:10.2f} ms ({ratio:5.2f}x){marker}")
+            if marker:
+                regressions.append((run['files'], label, ratio))
+    return regressions
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(prog="python index_generator_bench.py", description="index_generator 성능 측정")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_command = commands.add_parser("parser", help="Export 판별 방식 비교")
+    parser_command.add_argument("folders", nargs="+", help="측정할 폴더들")
+    parser_command.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    tree_options = argparse.ArgumentParser(add_help=False)
+    tree_options.add_argument("--depth", type=int, default=4, help="최대 폴더 깊이")
+    tree_options.add_argument("--seed", type=int, default=0, help="난수 시드 (같으면 같은 트리)")
+    tree_options.add_argument("--non-component", type=float, default=0.2, help="스캔 대상이 아닌 파일 비율")
+    tree_options.add_argument("--mean-size", type=int, default=2048, help="평균 파일 크기(바이트)")
+
+    generate_command = commands.add_parser("generate", parents=[tree_options], help="합성 컴포넌트 트리 생성")
+    generate_command.add_argument("root", help="트리를 만들 폴더")
+    generate_command.add_argument("--files", type=int, default=1000, help="파일 수")
+
+    suite_command = commands.add_parser("suite", parents=[tree_options], help="크기별 합성 트리로 스캔/렌더링/쓰기 측정")
+    suite_command.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="트리 파일 수들 (예: 1000 10000 100000)")
+    suite_command.add_argument("--repeat", type=int, default=3, help="스캔/렌더링 반복 횟수 (최소값 기록)")
+    suite_command.add_argument("--workers", type=int, help="파일 분석 워커 수")
+    suite_command.add_argument("--executor", choices=("thread", "process"), help="파일 분석 워커 종류")
+    suite_command.add_argument("--output", help="결과를 저장할 JSON 파일")
+    suite_command.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    suite_command.add_argument("--tolerance", type=float, default=0.2, help="이 비율보다 느려지면 회귀로 판단")
+    suite_command.add_argument("--keep", help="생성한 트리를 옮겨 둘 폴더")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "parser":
+        missing = [folder for folder in args.folders if not os.path.isdir(folder)]
+        if missing:
+            print(f"폴더를 찾을 수 없습니다: {', '.join(missing)}", file=sys.stderr)
+            return 1
+        bench_parser(args.folders, args.repeat)
+
+    elif args.command == "generate":
+        files, total_bytes = generate_tree(args.root, args.files, args.depth, args.seed, args.non_component, args.mean_size)
+        print(f"{args.root}에 파일 {files}개 ({total_bytes / (1024 * 1024):.1f} MiB)를 만들었습니다.")
+
+    elif args.command == "suite":
+        # 측정에 사용자 설정 파일이 끼어들지 않도록 기본 설정에서 시작
+        config = json.loads(json.dumps(DEFAULT_CONFIG))
+        if args.workers is not None:
+            config["scan_workers"] = args.workers
+        if args.executor:
+            config["scan_executor"] = args.executor
+
+        results = bench_suite(args.sizes, args.depth, args.seed, args.non_component, args.mean_size,
+                              args.repeat, config, args.keep)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+        else:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                regressions = compare_results(results, json.load(f), args.tolerance)
+            if regressions:
+                print(f"{len(regressions)}개 항목이 {args.tolerance:.0%} 넘게 느려졌습니다.", file=sys.stderr)
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,761 @@
+"""index_generator 엔진 위에 올린 Tk GUI"""
+import os
+import queue
+import threading
+from collections import deque
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from index_generator import (
+    CONFIG_FILE,
+    IndexEngine,
+    JobCancelled,
+    default_cache_file,
+    encode_index,
+    format_collision_warnings,
+    format_result_messages,
+    index_extension,
+    load_config,
+    save_config,
+    write_file_atomic,
+)
+
+TREE_BATCH_SIZE = 500  # after() 한 번에 트리에 넣을 최대 행 수
+TREE_PLACEHOLDER = "::placeholder"  # 펼치기 전 폴더 노드의 임시 자식 iid 접미사 (파일 행 iid는 "폴더::상대 경로")
+JOB_POLL_MS = 100  # 백그라운드 작업 진행 상황을 확인하는 간격
+
+
+class BackgroundJob:
+    """워커 스레드에서 target(job, *args)를 실행하고 진행 상황을 큐로 Tk 스레드에 넘기는 작업
+
+    target은 job.report(...)로 이벤트를 보내고 job.cancel_event를 엔진에 cancel로 넘깁니다.
+    Tk 위젯은 워커 스레드에서 건드리지 않고 poll할 때 events를 꺼내 반영합니다.
+    """
+
+    def __init__(self, name, target, *args):
+        self.name = name
+        self.cancel_event = threading.Event()
+        self.events = queue.Queue()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.thread = threading.Thread(target=self.run, args=(target, args), daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self, target, args):
+        try:
+            self.result = target(self, *args)
+        except JobCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+
+    def report(self, *event):
+        """워커 스레드에서 호출됨 - 이벤트를 큐에 넣기만 함"""
+        self.events.put(event)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def drain(self):
+        """쌓인 이벤트들을 꺼내 반환"""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class IndexFileGenerator:
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("React Components Index File Generator")
+        self.root.geometry("800x600")
+
+        # 설정 파일 경로
+        self.config_file = CONFIG_FILE
+        self.load_config()
+
+        self.engine = IndexEngine(self.config, default_cache_file(self.config_file))
+
+        self.setup_ui()
+
+    @property
+    def component_files(self):
+        """엔진이 스캔한 폴더별 컴포넌트 파일들"""
+        return self.engine.component_files
+
+    def load_config(self):
+        """설정 파일 로드"""
+        self.config = load_config(self.config_file)
+
+    def save_config(self):
+        """설정 파일 저장"""
+        save_config(self.config, self.config_file)
+
+    def setup_ui(self):
+        """UI 설정"""
+        # 메인 프레임
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # 폴더 선택 영역
+        folder_frame = ttk.LabelFrame(main_frame, text="폴더 선택", padding="10")
+        folder_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        # 선택된 폴더들을 표시할 리스트박스
+        ttk.Label(folder_frame, text="선택된 폴더들:").grid(row=0, column=0, sticky=tk.W)
+
+        list_frame = ttk.Frame(folder_frame)
+        list_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=(0, 10))
+
+        self.folder_listbox = tk.Listbox(list_frame, height=4, selectmode=tk.SINGLE)
+        folder_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.folder_listbox.yview)
+        self.folder_listbox.configure(yscrollcommand=folder_scrollbar.set)
+
+        self.folder_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        folder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # 버튼들
+        button_frame = ttk.Frame(folder_frame)
+        button_frame.grid(row=1, column=1, sticky=tk.N)
+
+        ttk.Button(button_frame, text="폴더 추가", command=self.add_folder).pack(pady=2)
+        ttk.Button(button_frame, text="선택 제거", command=self.remove_folder).pack(pady=2)
+        ttk.Button(button_frame, text="모두 제거", command=self.clear_folders).pack(pady=2)
+
+        folder_frame.columnconfigure(0, weight=1)
+        list_frame.columnconfigure(0, weight=1)
+
+        # 선택된 폴더들 저장할 리스트
+        self.selected_folders = []
+
+        # 설정 영역
+        settings_frame = ttk.LabelFrame(main_frame, text="설정", padding="10")
+        settings_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        # TypeScript/JavaScript 선택
+        self.use_typescript = tk.BooleanVar(value=self.config["use_typescript"])
+        ttk.Checkbutton(settings_frame, text="TypeScript 사용 (.ts/.tsx)", variable=self.use_typescript).grid(row=0, column=0, sticky=tk.W)
+
+        # Export 스타일 선택
+        ttk.Label(settings_frame, text="Export 스타일:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
+        self.export_style = tk.StringVar(value=self.config["export_style"])
+        ttk.Radiobutton(settings_frame, text="Named exports (export { Component })", variable=self.export_style, value="named").grid(row=2, column=0, sticky=tk.W)
+        ttk.Radiobutton(settings_frame, text="Re-exports (export * from './Component')", variable=self.export_style, value="reexport").grid(row=3, column=0, sticky=tk.W)
+        ttk.Radiobutton(settings_frame, text="Lazy (export const Component = lazy(() => import('./Component')))", variable=self.export_style, value="lazy").grid(row=4, column=0, sticky=tk.W)
+
+        # 하위 폴더마다 Index 생성 (barrel 트리)
+        self.barrel_tree = tk.BooleanVar(value=self.config.get("barrel_mode") == "tree")
+        ttk.Checkbutton(settings_frame, text="하위 폴더마다 Index 파일 생성 (상위 Index가 하위 Index를 re-export)", variable=self.barrel_tree).grid(row=5, column=0, sticky=tk.W, pady=(10, 0))
+
+        # 파일 목록 영역
+        files_frame = ttk.LabelFrame(main_frame, text="발견된 컴포넌트 파일들", padding="10")
+        files_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
+        # 트리뷰 생성
+        self.file_tree = ttk.Treeview(files_frame, columns=('path', 'type'), show='tree headings')
+        self.file_tree.heading('#0', text='파일명')
+        self.file_tree.heading('path', text='경로')
+        self.file_tree.heading('type', text='타입')
+
+        # 스크롤바
+        scrollbar = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
+        self.file_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.file_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+
+        # 파일 행은 폴더를 펼칠 때 after() 배치로 채움
+        self.file_tree.bind('<<TreeviewOpen>>', self.on_tree_open)
+        self.tree_rows = {}  # 펼친 폴더 -> {파일 iid: values}
+        self.tree_queue = deque()  # (폴더, 위치, file_info)
+        self.tree_job = None
+
+        files_frame.columnconfigure(0, weight=1)
+        files_frame.rowconfigure(0, weight=1)
+
+        # 미리보기 영역
+        preview_frame = ttk.LabelFrame(main_frame, text="생성될 Index 파일 미리보기", padding="10")
+        preview_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
+        self.preview_text = tk.Text(preview_frame, height=10, width=80)
+        preview_scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.preview_text.yview)
+        self.preview_text.configure(yscrollcommand=preview_scrollbar.set)
+
+        self.preview_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        preview_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+
+        preview_frame.columnconfigure(0, weight=1)
+        preview_frame.rowconfigure(0, weight=1)
+
+        # 버튼 영역
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+
+        # 작업 중에는 비활성화할 버튼들
+        self.action_buttons = [
+            ttk.Button(button_frame, text="파일 스캔", command=self.scan_files),
+            ttk.Button(button_frame, text="미리보기 생성", command=self.generate_preview),
+            ttk.Button(button_frame, text="선택한 폴더들에 Index 파일 생성", command=self.generate_index_files)
+        ]
+        for button in self.action_buttons:
+            button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="설정 저장", command=self.save_config).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="프로파일 보기", command=self.show_profile).pack(side=tk.LEFT, padx=5)
+
+        # 진행 상황 영역
+        progress_frame = ttk.Frame(main_frame)
+        progress_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E))
+
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.status_label = ttk.Label(progress_frame, text="")
+        self.status_label.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(progress_frame, text="취소", command=self.cancel_job, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT)
+
+        # 백그라운드 작업 상태 (엔진은 한 번에 한 작업만 사용)
+        self.job = None
+        self.job_done = None  # 작업이 끝나면 Tk 스레드에서 호출할 함수
+        self.rescan_pending = False
+        self.preview_pending = False
+
+        # 그리드 가중치 설정
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(2, weight=1)
+        main_frame.rowconfigure(3, weight=1)
+
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+
+        # 변수 변경 시 미리보기 자동 업데이트
+        self.use_typescript.trace('w', lambda *args: self.generate_preview())
+        self.export_style.trace('w', lambda *args: self.generate_preview())
+        self.barrel_tree.trace('w', lambda *args: self.on_barrel_mode_changed())
+
+    def on_barrel_mode_changed(self):
+        """barrel 트리 옵션을 엔진 설정에 반영하고 미리보기 갱신"""
+        self.config["barrel_mode"] = "tree" if self.barrel_tree.get() else "flat"
+        self.generate_preview()
+
+    def add_folder(self):
+        """폴더 추가 다이얼로그"""
+        folder_selected = filedialog.askdirectory(
+            title="컴포넌트 폴더를 선택하세요",
+            initialdir=self.config.get("last_directory", "")
+        )
+
+        if folder_selected:
+            if folder_selected not in self.selected_folders:
+                self.selected_folders.append(folder_selected)
+                self.folder_listbox.insert(tk.END, folder_selected)
+                self.config["last_directory"] = folder_selected
+                self.scan_files()
+            else:
+                messagebox.showinfo("알림", "이미 선택된 폴더입니다.")
+
+    def remove_folder(self):
+        """선택된 폴더 제거"""
+        selection = self.folder_listbox.curselection()
+        if selection:
+            index = selection[0]
+            removed_folder = self.selected_folders.pop(index)
+            self.folder_listbox.delete(index)
+            if self.job_running():
+                # 작업이 끝날 때 결과에서 제거됨 (poll_job)
+                return
+            # 남은 폴더는 다시 스캔하지 않고 결과에서 해당 폴더만 제거
+            self.engine.remove_folder(removed_folder)
+            self.refresh_file_tree()
+            if self.selected_folders:
+                self.generate_preview()
+        else:
+            messagebox.showwarning("경고", "제거할 폴더를 선택해주세요.")
+
+    def clear_folders(self):
+        """모든 폴더 제거"""
+        if self.selected_folders:
+            if messagebox.askyesno("확인", "모든 폴더를 제거하시겠습니까?"):
+                self.selected_folders.clear()
+                self.folder_listbox.delete(0, tk.END)
+                # 파일 트리와 미리보기도 초기화
+                self.clear_file_tree()
+                self.preview_text.delete(1.0, tk.END)
+                if self.job_running():
+                    self.cancel_job()
+                else:
+                    self.component_files.clear()
+
+    def select_folder(self):
+        """이전 버전과의 호환성을 위해 남겨둠"""
+        self.add_folder()
+
+    def start_job(self, name, target, args, on_done):
+        """target을 백그라운드 작업으로 실행하고 끝나면 on_done(job) 호출"""
+        self.job = BackgroundJob(name, target, *args).start()
+        self.job_done = on_done
+        self.progress_bar.configure(maximum=1, value=0)
+        for button in self.action_buttons:
+            button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.root.after(JOB_POLL_MS, self.poll_job)
+
+    def job_running(self):
+        return self.job is not None and self.job.is_alive()
+
+    def cancel_job(self):
+        """진행 중인 작업 취소 요청 (워커가 다음 파일로 넘어갈 때 멈춤)"""
+        if self.job_running():
+            self.job.cancel()
+            self.rescan_pending = False
+            self.status_label.configure(text="취소하는 중...")
+
+    def poll_job(self):
+        """작업에서 온 이벤트를 진행 막대와 상태 표시에 반영"""
+        job = self.job
+        for event in job.drain():
+            self.on_job_event(job, event)
+
+        if job.is_alive():
+            self.root.after(JOB_POLL_MS, self.poll_job)
+            return
+
+        for event in job.drain():
+            self.on_job_event(job, event)
+        self.job = None
+
+        # 작업 도중 제거된 폴더는 결과에서 제외
+        for folder in list(self.component_files):
+            if folder not in self.selected_folders:
+                self.engine.remove_folder(folder)
+
+        for button in self.action_buttons:
+            button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.status_label.configure(text="")
+
+        on_done, self.job_done = self.job_done, None
+        on_done(job)
+
+        # 작업 중에 요청된 재스캔과 미리보기는 다른 작업이 없을 때 실행 (재스캔이 끝나면 미리보기도 갱신됨)
+        if self.job is None and self.rescan_pending:
+            self.rescan_pending = False
+            self.scan_files()
+        elif self.job is None and self.preview_pending:
+            self.generate_preview()
+
+    def on_job_event(self, job, event):
+        """(종류, done, total, 메시지) 이벤트 처리 - 'result'는 메시지를 결과 창에 한 줄씩 추가"""
+        kind, done, total, message = event
+        self.progress_bar.configure(maximum=max(total, 1), value=done)
+        if not job.cancel_event.is_set():
+            self.status_label.configure(text=f"{message} ({done}/{total})" if kind == 'result' else message)
+        if kind == 'result':
+            self.preview_text.insert(tk.END, message + "\n")
+            self.preview_text.see(tk.END)
+
+    def scan_files(self):
+        """선택된 모든 폴더에서 컴포넌트 파일들 스캔"""
+        if not self.selected_folders:
+            self.refresh_file_tree()
+            return
+
+        if self.job_running():
+            # 진행 중인 작업이 끝나면 다시 스캔
+            self.rescan_pending = True
+            return
+
+        # 분석은 워커 스레드에서 실행하고 Tk 이벤트 루프는 진행 상황만 폴링
+        self.start_job('scan', self.run_scan, (list(self.selected_folders),), self.finish_scan)
+
+    def run_scan(self, job, folders):
+        """워커 스레드에서 엔진 스캔 실행"""
+        def progress(done, total):
+            job.report('progress', done, total, f"분석 중... {done}/{total}")
+
+        self.engine.scan_files(folders, progress, job.cancel_event)
+
+    def finish_scan(self, job):
+        """스캔 완료 후 파일 트리와 미리보기 갱신"""
+        if self.rescan_pending:
+            # 곧 다시 스캔하므로 지난 결과로 트리를 그리지 않음 (재스캔은 poll_job에서 시작)
+            return
+
+        if job.cancelled:
+            self.status_label.configure(text="스캔을 취소했습니다. (이전 스캔 결과 유지)")
+            return
+
+        if job.error:
+            messagebox.showerror("오류", f"스캔 중 오류가 발생했습니다: {job.error}")
+            return
+
+        self.refresh_file_tree()
+
+        self.generate_preview()
+        message = f"{len(self.selected_folders)}개 폴더에서 총 {self.engine.total_files}개의 컴포넌트 파일을 찾았습니다."
+        if self.engine.cache:
+            message += f"\n캐시: {self.engine.cache.hits}개 적중, {self.engine.cache.misses}개 새로 분석"
+        collisions = self.engine.find_collisions(index_extension(self.use_typescript.get()), self.export_style.get())
+        if collisions:
+            message += "\n" + "\n".join(format_collision_warnings(collisions, self.config["collision_policy"], limit=5))
+        messagebox.showinfo("완료", message)
+
+    def refresh_file_tree(self):
+        """스캔 결과와 현재 트리를 비교해 바뀐 노드만 갱신
+
+        폴더 노드만 바로 만들고, 파일 행은 펼친 폴더에 대해서만 after() 배치로 넣습니다.
+        """
+        if not self.selected_folders:
+            self.clear_file_tree()
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(1.0, "// 폴더를 추가해주세요.")
+            return
+
+        with self.engine.profiler.phase('tree'):
+            # 결과에서 사라진 폴더 노드 제거
+            stale = [folder for folder in self.file_tree.get_children() if folder not in self.component_files]
+            if stale:
+                self.file_tree.delete(*stale)
+            for folder in stale:
+                self.tree_rows.pop(folder, None)
+            self.tree_queue = deque(entry for entry in self.tree_queue if entry[0] in self.component_files)
+
+            for folder, folder_files in self.component_files.items():
+                self.refresh_folder_node(folder, folder_files)
+
+        self.schedule_tree_batch()
+
+    def refresh_folder_node(self, folder, folder_files):
+        """폴더 노드 하나를 만들거나 갱신"""
+        text = f"📁 {os.path.basename(folder)} ({len(folder_files)})"
+        if not self.file_tree.exists(folder):
+            self.file_tree.insert('', 'end', iid=folder, text=text, values=(folder, 'folder'))
+        else:
+            self.file_tree.item(folder, text=text)
+
+        if folder not in self.tree_rows:
+            # 아직 펼치지 않은 폴더는 임시 자식만 두고 파일 행은 만들지 않음
+            children = self.file_tree.get_children(folder)
+            if children:
+                self.file_tree.delete(*children)
+            if folder_files:
+                self.file_tree.insert(folder, 'end', iid=folder + TREE_PLACEHOLDER, text="...")
+            else:
+                self.file_tree.insert(folder, 'end', text="(컴포넌트 파일 없음)", values=("", "empty"))
+            return
+
+        self.diff_folder_rows(folder, folder_files)
+
+    def diff_folder_rows(self, folder, folder_files):
+        """펼친 폴더의 파일 행을 새 스캔 결과와 비교해 추가/삭제/수정할 행만 처리"""
+        rows = self.tree_rows[folder]
+        ordered = sorted(folder_files, key=lambda x: x['relative_path'])
+        wanted = {self.file_row_iid(folder, file_info) for file_info in ordered}
+        self.tree_queue = deque(entry for entry in self.tree_queue if entry[0] != folder)
+
+        removed = [iid for iid in rows if iid not in wanted]
+        if removed:
+            self.file_tree.delete(*removed)
+        for iid in removed:
+            del rows[iid]
+
+        # "(컴포넌트 파일 없음)" 표시는 매번 다시 판단하고, 임시 자식은 첫 행을 넣을 때 지움
+        placeholder = folder + TREE_PLACEHOLDER
+        others = [iid for iid in self.file_tree.get_children(folder) if iid not in rows and (iid != placeholder or not ordered)]
+        if others:
+            self.file_tree.delete(*others)
+        if not ordered:
+            self.file_tree.insert(folder, 'end', text="(컴포넌트 파일 없음)", values=("", "empty"))
+            return
+
+        # 남은 행은 상대 순서가 유지되므로 새 행을 앞에서부터 제자리에 넣으면 정렬이 맞음
+        for index, file_info in enumerate(ordered):
+            iid = self.file_row_iid(folder, file_info)
+            values = self.file_row_values(file_info)
+            if iid not in rows:
+                self.tree_queue.append((folder, index, file_info))
+            elif rows[iid] != values:
+                rows[iid] = values
+                self.file_tree.item(iid, values=values)
+
+    def file_row_iid(self, folder, file_info):
+        """파일 행 iid (중첩된 폴더를 함께 선택해도 겹치지 않도록 폴더를 붙임)"""
+        return f"{folder}::{file_info['relative_path']}"
+
+    def file_row_values(self, file_info):
+        """파일 행에 표시할 (경로, 타입) 값"""
+        export_type = file_info['export_type']
+        if file_info['truncated']:
+            export_type += " (앞부분만 분석)"
+        return (file_info['relative_path'], export_type)
+
+    def on_tree_open(self, event):
+        """폴더를 처음 펼칠 때 파일 행을 배치로 채우기 시작"""
+        folder = self.file_tree.focus()
+        if folder in self.tree_rows or folder not in self.component_files:
+            return
+
+        self.tree_rows[folder] = {}
+        self.diff_folder_rows(folder, self.component_files[folder])
+        self.schedule_tree_batch()
+
+    def schedule_tree_batch(self):
+        """대기 중인 행이 있으면 다음 배치를 예약"""
+        if self.tree_queue and self.tree_job is None:
+            self.tree_job = self.root.after(1, self.insert_tree_batch)
+
+    def insert_tree_batch(self):
+        """대기 중인 파일 행을 TREE_BATCH_SIZE개씩 트리에 추가"""
+        self.tree_job = None
+        with self.engine.profiler.phase('tree'):
+            for _ in range(min(TREE_BATCH_SIZE, len(self.tree_queue))):
+                folder, index, file_info = self.tree_queue.popleft()
+                rows = self.tree_rows.get(folder)
+                iid = self.file_row_iid(folder, file_info)
+                if rows is None or iid in rows:
+                    continue
+                placeholder = folder + TREE_PLACEHOLDER
+                if self.file_tree.exists(placeholder):
+                    self.file_tree.delete(placeholder)
+                rows[iid] = self.file_row_values(file_info)
+                self.file_tree.insert(folder, index, iid=iid, text=file_info['filename'], values=rows[iid])
+        self.schedule_tree_batch()
+
+    def clear_file_tree(self):
+        """파일 트리와 대기 중인 배치 모두 비우기"""
+        if self.tree_job is not None:
+            self.root.after_cancel(self.tree_job)
+            self.tree_job = None
+        self.tree_queue.clear()
+        self.tree_rows.clear()
+        children = self.file_tree.get_children()
+        if children:
+            self.file_tree.delete(*children)
+
+    def show_profile(self):
+        """마지막 스캔의 단계별 소요 시간 표시"""
+        messagebox.showinfo("프로파일", '\n'.join(self.engine.profiler.format_report()))
+
+    def extract_component_info(self, file_path, filename):
+        """파일에서 컴포넌트 정보 추출"""
+        return self.engine.extract_component_info(file_path, filename)
+
+    def generate_preview(self):
+        """여러 폴더의 Index 파일 미리보기 생성 (렌더링은 백그라운드 작업)"""
+        if not self.component_files:
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(1.0, "// 먼저 파일을 스캔해주세요.")
+            return
+
+        if self.job_running():
+            # 스캔이나 쓰기가 끝난 뒤에 최신 옵션으로 다시 렌더링
+            self.preview_pending = True
+            return
+
+        self.preview_pending = False
+        extension = index_extension(self.use_typescript.get())
+        self.start_job('preview', self.run_preview, (self.export_style.get(), extension), self.finish_preview)
+
+    def run_preview(self, job, export_style, extension):
+        """워커 스레드에서 미리보기 렌더링"""
+        job.report('progress', 0, 1, "미리보기 생성 중...")
+        return self.engine.render_preview(export_style, extension)
+
+    def finish_preview(self, job):
+        if job.error:
+            messagebox.showerror("오류", f"미리보기 생성 중 오류가 발생했습니다: {job.error}")
+            return
+        if job.result is not None:
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(1.0, job.result)
+
+    def confirm_overwrite(self, folder, index_path):
+        """기존 Index 파일 덮어쓰기 확인 (파일마다 묻는 이전 방식, generate_index_file에서 사용)"""
+        folder_name = os.path.basename(folder)
+        index_filename = os.path.basename(index_path)
+        return messagebox.askyesnocancel(
+            "확인",
+            f"{folder_name} 폴더의 {index_filename} 파일이 이미 존재합니다.\n\n"
+            f"예: 덮어쓰기\n아니오: 건너뛰기\n취소: 전체 작업 중단"
+        )
+
+    def ask_overwrite_batch(self, conflicts):
+        """덮어쓸 기존 Index 파일들을 한 번에 고르는 창 - 덮어쓸 경로 집합 반환 (취소하면 None)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("기존 Index 파일 덮어쓰기")
+        dialog.transient(self.root)
+
+        ttk.Label(dialog, text=f"내용이 다른 Index 파일 {len(conflicts)}개가 이미 있습니다. 덮어쓸 파일을 선택하세요.",
+                  padding="10").pack(fill=tk.X)
+
+        list_frame = ttk.Frame(dialog, padding=(10, 0))
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE, width=80, height=min(len(conflicts), 15))
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for _, index_path in conflicts:
+            listbox.insert(tk.END, index_path)
+        listbox.selection_set(0, tk.END)
+
+        answer = {'paths': None}
+
+        def finish(paths):
+            answer['paths'] = paths
+            dialog.destroy()
+
+        button_frame = ttk.Frame(dialog, padding="10")
+        button_frame.pack()
+        ttk.Button(button_frame, text="선택한 파일 덮어쓰기",
+                   command=lambda: finish({conflicts[i][1] for i in listbox.curselection()})).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="모두 건너뛰기", command=lambda: finish(set())).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="취소", command=lambda: finish(None)).pack(side=tk.LEFT, padx=5)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: finish(None))
+
+        dialog.grab_set()
+        self.root.wait_window(dialog)
+        return answer['paths']
+
+    def generate_index_files(self):
+        """선택된 모든 폴더에 Index 파일들 생성
+
+        렌더링과 기존 파일 비교, 쓰기는 백그라운드 작업으로 실행하고
+        덮어쓸 파일은 그 사이에 한 번에 묻습니다.
+        """
+        if not self.selected_folders:
+            messagebox.showerror("오류", "폴더를 선택해주세요.")
+            return
+
+        if not self.component_files:
+            messagebox.showerror("오류", "먼저 파일을 스캔해주세요.")
+            return
+
+        if self.job_running():
+            messagebox.showwarning("경고", "진행 중인 작업이 끝난 뒤에 다시 시도해주세요.")
+            return
+
+        extension = index_extension(self.use_typescript.get())
+        self.start_job('plan', self.run_plan, (extension, self.export_style.get()), self.finish_plan)
+
+    def run_plan(self, job, extension, export_style):
+        """워커 스레드에서 쓸 내용을 렌더링하고 덮어쓸 파일 찾기"""
+        job.report('progress', 0, 1, "Index 파일 준비 중...")
+        plan, errors = self.engine.prepare_index_files(extension, export_style)
+        if job.cancel_event.is_set():
+            raise JobCancelled()
+        return plan, errors, self.engine.overwrite_conflicts(plan)
+
+    def finish_plan(self, job):
+        """덮어쓸 파일을 한 번에 물은 뒤 쓰기 작업 시작"""
+        if job.cancelled:
+            self.status_label.configure(text="생성을 취소했습니다.")
+            return
+        if job.error:
+            messagebox.showerror("오류", f"Index 파일 준비 중 오류가 발생했습니다: {job.error}")
+            return
+
+        plan, errors, conflicts = job.result
+        overwrite = set()
+        if conflicts:
+            overwrite = self.ask_overwrite_batch(conflicts)
+            if overwrite is None:
+                self.status_label.configure(text="생성을 취소했습니다.")
+                return
+
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(1.0, "// Index 파일 생성 결과\n")
+        self.start_job('write', self.run_write, (plan, errors, overwrite), self.finish_write)
+
+    def run_write(self, job, plan, errors, overwrite):
+        """워커 스레드에서 Index 파일 쓰기 - 파일마다 결과를 보냄"""
+        icons = {'created': "✅", 'unchanged': "=", 'skipped': "⏭️", 'error': "❌"}
+
+        def progress(done, total, index_path, status):
+            job.report('result', done, total, f"{icons[status]} {index_path}")
+
+        result = self.engine.write_plan(plan, lambda folder, index_path: index_path in overwrite,
+                                        progress, job.cancel_event)
+        result['errors'].extend(errors.items())
+        return result
+
+    def finish_write(self, job):
+        """쓰기 작업 결과 메시지 표시"""
+        if job.error:
+            messagebox.showerror("오류", f"파일 생성 중 오류가 발생했습니다: {job.error}")
+            return
+        result = job.result
+
+        # 결과 메시지
+        messages = format_result_messages(result)
+
+        if messages:
+            # 설정 저장
+            self.config["use_typescript"] = self.use_typescript.get()
+            self.config["export_style"] = self.export_style.get()
+            self.save_config()
+
+            result_message = '\n'.join(messages)
+            if result['errors']:
+                messagebox.showerror("완료 (오류 포함)", result_message)
+            else:
+                messagebox.showinfo("완료", result_message)
+        else:
+            messagebox.showwarning("경고", "생성된 파일이 없습니다.")
+
+    def generate_index_file(self):
+        """이전 버전과의 호환성을 위해 남겨둠 - 단일 폴더용"""
+        if not self.selected_folders:
+            messagebox.showerror("오류", "폴더를 선택해주세요.")
+            return
+
+        # 첫 번째 선택된 폴더만 처리 (이전 버전 호환성)
+        folder = self.selected_folders[0] if self.selected_folders else None
+        if not folder or not os.path.exists(folder):
+            messagebox.showerror("오류", "유효한 폴더를 선택해주세요.")
+            return
+
+        if folder not in self.component_files:
+            messagebox.showerror("오류", "먼저 파일을 스캔해주세요.")
+            return
+
+        extension = index_extension(self.use_typescript.get())
+        index_filename = f"index{extension}"
+        index_path = os.path.join(folder, index_filename)
+
+        # 기존 파일이 있으면 확인
+        if os.path.exists(index_path):
+            if not messagebox.askyesno("확인", f"{index_filename} 파일이 이미 존재합니다. 덮어쓰시겠습니까?"):
+                return
+
+        try:
+            final_content = self.engine.render_folder(folder, self.component_files[folder], self.export_style.get(), extension, "flat")[0][1]
+
+            write_file_atomic(index_path, encode_index(final_content))
+
+            # 설정 저장
+            self.config["use_typescript"] = self.use_typescript.get()
+            self.config["export_style"] = self.export_style.get()
+            self.save_config()
+
+            messagebox.showinfo("완료", f"{index_path}에 Index 파일이 생성되었습니다.")
+
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 생성 중 오류가 발생했습니다: {str(e)}")
+
+    def run(self):
+        """프로그램 실행"""
+        self.root.mainloop()
+
+
+if __name__ == "__main__":
+    app = IndexFileGenerator()
+    app.run()
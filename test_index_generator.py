@@ -0,0 +1,125 @@
+"""index_generator 스캐너와 렌더링 테스트 (python -m unittest test_index_generator)"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from index_generator import DEFAULT_CONFIG, IndexEngine, scan_exports
+
+# (설명, 파일 내용, scan_exports에서 확인할 키와 기대값)
+SCAN_CASES = [
+    ("템플릿 리터럴 동적 import", "const m = import(`./x`)\nexport const a = 1",
+     {'names': ['a'], 'imports': []}),
+    ("정규식 리터럴 require", "const r = require(/x/)\nexport function b() {}",
+     {'names': ['b'], 'imports': []}),
+    ("JSX 텍스트의 아포스트로피", "export default function P() { return <p>Don't</p> }\nexport const c = 2",
+     {'default': True, 'names': ['c']}),
+    ("default로 이름을 바꾼 export", "const a = 1\nexport { a as default }",
+     {'default': True, 'names': []}),
+    ("재export", "export * from './ui'\nexport { x as y } from './z'",
+     {'names': ['y'], 'star': True,
+      'imports': [['./ui', 'reexport', [['*', None]]], ['./z', 'reexport', [['x', 'y']]]]}),
+    ("타입 export", "export type T = {}\nexport interface I {}\nexport type { U } from './u'",
+     {'names': [], 'types': ['T', 'I', 'U']}),
+    ("구조 분해 선언", "export const { d, e: f, ...g } = obj, [h, i] = arr",
+     {'names': ['d', 'f', 'g', 'h', 'i']}),
+    ("초기값 안의 정규식, 문자열, 템플릿 괄호",
+     "export const re = /export const no = 1/g, s = '}', t = `${'{'}`\nexport const after = 1",
+     {'names': ['re', 's', 't', 'after']}),
+    ("import 문", "import X, { Y as Z } from './m'\nimport * as NS from '../ns'\nimport './side.css'",
+     {'imports': [['./m', 'import', [['default', 'X'], ['Y', 'Z']]], ['../ns', 'import', [['*', 'NS']]],
+                  ['./side.css', 'import', []]]}),
+    ("멤버 호출과 나눗셈", "foo.import('./no')\nconst x = a / b / c\nexport const ok = 1",
+     {'names': ['ok'], 'imports': []}),
+    ("주석 안의 export", "// export const commented = 1\n/* export const block = 1 */\nexport let z = 1",
+     {'names': ['z']}),
+    ("함수 안의 export", "function f() {\n  export const inner = 1\n}\nexport const outer = 1",
+     {'names': ['outer']}),
+    ("키워드가 없는 파일", "const x = 1\n",
+     {'default': False, 'names': [], 'types': [], 'star': False, 'imports': []}),
+]
+
+
+class ScanExportsTest(unittest.TestCase):
+
+    def test_cases(self):
+        for description, content, expected in SCAN_CASES:
+            with self.subTest(description):
+                exports = scan_exports(content)
+                self.assertEqual({key: exports[key] for key in expected}, expected)
+
+    def test_bytes_and_str_match(self):
+        for description, content, _ in SCAN_CASES:
+            with self.subTest(description):
+                self.assertEqual(scan_exports(content.encode('utf-8')), scan_exports(content))
+
+
+class EngineTest(unittest.TestCase):
+    """임시 폴더에 파일을 만들고 스캔한 엔진으로 충돌, 트리 plan, 순환 확인"""
+
+    def make_engine(self, files, **options):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        for relative_path, content in files.items():
+            path = os.path.join(self.root, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        config = json.loads(json.dumps(DEFAULT_CONFIG))
+        config.update(options)
+        engine = IndexEngine(config)
+        engine.scan_files([self.root])
+        return engine
+
+    def plan(self, engine):
+        return {os.path.relpath(path, self.root): content
+                for _, path, content in engine.plan_index_files('.ts', 'named')}
+
+    def test_prefix_collision(self):
+        engine = self.make_engine({
+            'a/Button.tsx': 'export const Button = 1',
+            'b/Button.tsx': 'export const Button = 2',
+            'c/Card.tsx': 'export default function Card() {}',
+        }, collision_policy='prefix')
+        overrides, found = engine.collision_overrides(self.root, 'named', '.ts')
+        self.assertEqual(overrides, {os.path.join(self.root, 'a', 'Button.tsx'): {'Button': 'AButton'},
+                                     os.path.join(self.root, 'b', 'Button.tsx'): {'Button': 'BButton'}})
+        self.assertEqual([(name, resolved) for _, name, _, resolved in found], [('Button', True)])
+        lines = self.plan(engine)['index.ts'].splitlines()
+        self.assertIn("export { Button as AButton } from './a/Button'", lines)
+        self.assertIn("export { Button as BButton } from './b/Button'", lines)
+        self.assertIn("export { default as Card } from './c/Card'", lines)
+
+    def test_existing_index_is_not_a_collision(self):
+        engine = self.make_engine({
+            'Button.tsx': 'export const Button = 1',
+            'index.js': "export { Button } from './Button'",
+        })
+        _, found = engine.collision_overrides(self.root, 'named', '.ts')
+        self.assertEqual(found, [])
+        self.assertNotIn('./index', self.plan(engine)['index.ts'])
+
+    def test_tree_plan(self):
+        engine = self.make_engine({
+            'a/Button.tsx': 'export const Button = 1',
+            'a/b/Card.tsx': 'export const Card = 2',
+        }, barrel_mode='tree')
+        self.assertEqual(self.plan(engine), {
+            os.path.join('a', 'b', 'index.ts'): "export { Card } from './Card'",
+            os.path.join('a', 'index.ts'): "export { Button } from './Button'\nexport * from './b'",
+            'index.ts': "export * from './a'",
+        })
+
+    def test_barrel_cycle(self):
+        engine = self.make_engine({
+            'a/Button.tsx': "import { Card } from '..'\nexport const Button = 1",
+            'Card.tsx': 'export const Card = 2',
+        }, path_aliases={})
+        cycles = [[os.path.abspath(node) for node in cycle] for cycle in engine.find_cycles()]
+        self.assertEqual(cycles, [[os.path.join(self.root, 'a', 'Button.tsx'), os.path.join(self.root, 'index')]])
+
+
+if __name__ == '__main__':
+    unittest.main()